@@ -1,4 +1,3 @@
-import rdflib
 import uuid
 
 from PyQt5.QtWidgets import (
@@ -11,9 +10,33 @@ from PyQt5.QtCore import Qt
 from src.app.items import EntityItem
 
 
-REF = rdflib.Namespace("https://brickschema.org/schema/Brick/ref#")
-BACNET = rdflib.Namespace("http://data.ashrae.org/bacnet/2020#")
-BRICK = rdflib.Namespace("https://brickschema.org/schema/Brick#")
+def _get_ref_display_text(ref_data):
+    """Generate a user-friendly string for the list."""
+    ref_type = ref_data.get("type", "Unknown")
+    details = ""
+    if ref_type == "BACnet":
+        option = ref_data.get("option", 0)
+        if option == 1:
+            details = f"BACnet (Fields): ID={ref_data.get('object-identifier', 'N/A')}"
+        elif option == 2:
+            details = f"BACnet (URI): {ref_data.get('BACnetURI', 'N/A')}"
+        else:
+            details = f"BACnet (Unknown Option)"
+    elif ref_type == "Timeseries":
+        details = f"Timeseries: ID={ref_data.get('timeseriesId', 'N/A')}"
+    else:
+        details = f"{ref_type}: ID={ref_data.get('id', 'N/A')}"
+    return details
+
+
+def _field_text(edit):
+    """Return the stripped text of a line edit."""
+    return edit.text().strip()
+
+
+def _refresh_display(ref_data):
+    """Cache the list text on the reference so the list only reads a string."""
+    ref_data['_display'] = _get_ref_display_text(ref_data)
 
 
 class AddEditReferenceDialog(QDialog):
@@ -24,6 +47,18 @@ class AddEditReferenceDialog(QDialog):
         self.existing_ref = existing_ref
         self.setWindowTitle("Add/Edit External Reference" if not existing_ref else "Edit External Reference")
 
+        self._setup_ui()
+
+        # --- Initialization ---
+        self.ref_data = None
+        if self.existing_ref:
+            self._load_existing_data()
+        else:
+            self._update_form()  # Trigger initial form display
+
+        self.setMinimumWidth(400)
+
+    def _setup_ui(self):
         self.layout = QVBoxLayout(self)
 
         # --- Type Selection ---
@@ -35,10 +70,22 @@ class AddEditReferenceDialog(QDialog):
         self.layout.addWidget(self.type_combo)
 
         # --- Stacked Widget for Forms ---
+        # Pages are built on first use, so only the selected form is created
         self.stacked_widget = QStackedWidget()
         self.layout.addWidget(self.stacked_widget)
+        self.bacnet_widget = None
+        self.bacnet_opt1_widget = None
+        self.bacnet_opt2_widget = None
+        self.timeseries_widget = None
 
-        # --- BACnet Form ---
+        # --- Dialog Buttons ---
+        self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+    def _build_bacnet_widget(self):
+        """Create the BACnet page with its format options."""
         self.bacnet_widget = QWidget()
         bacnet_layout = QVBoxLayout(self.bacnet_widget)
         bacnet_layout.setContentsMargins(0, 0, 0, 0)
@@ -48,6 +95,7 @@ class AddEditReferenceDialog(QDialog):
         bacnet_options_layout = QHBoxLayout()
         self.bacnet_option1_radio = QRadioButton("Option 1: Fields")
         self.bacnet_option2_radio = QRadioButton("Option 2: URI")
+        self.bacnet_option1_radio.setChecked(True)  # Default selection
         self.bacnet_option1_radio.toggled.connect(self._update_bacnet_options)
         bacnet_options_layout.addWidget(self.bacnet_option1_radio)
         bacnet_options_layout.addWidget(self.bacnet_option2_radio)
@@ -57,7 +105,10 @@ class AddEditReferenceDialog(QDialog):
         self.bacnet_option_stack = QStackedWidget()
         bacnet_layout.addWidget(self.bacnet_option_stack)
 
-        # BACnet Option 1 Fields
+        self.stacked_widget.addWidget(self.bacnet_widget)
+
+    def _build_bacnet_opt1(self):
+        """Create the BACnet Option 1 (fields) page."""
         self.bacnet_opt1_widget = QWidget()
         bacnet_opt1_form = QFormLayout(self.bacnet_opt1_widget)
         self.bacnet_obj_id_edit = QLineEdit()
@@ -75,7 +126,8 @@ class AddEditReferenceDialog(QDialog):
         bacnet_opt1_form.addRow("Object Of (Device URI):", self.bacnet_obj_of_edit)
         self.bacnet_option_stack.addWidget(self.bacnet_opt1_widget)
 
-        # BACnet Option 2 Fields
+    def _build_bacnet_opt2(self):
+        """Create the BACnet Option 2 (URI) page."""
         self.bacnet_opt2_widget = QWidget()
         bacnet_opt2_form = QFormLayout(self.bacnet_opt2_widget)
         self.bacnet_uri_edit = QLineEdit()
@@ -85,9 +137,8 @@ class AddEditReferenceDialog(QDialog):
         bacnet_opt2_form.addRow("Object Of (Device URI):", self.bacnet_obj_of_edit_opt2)
         self.bacnet_option_stack.addWidget(self.bacnet_opt2_widget)
 
-        self.stacked_widget.addWidget(self.bacnet_widget)
-
-        # --- Timeseries Form ---
+    def _build_timeseries(self):
+        """Create the Timeseries page."""
         self.timeseries_widget = QWidget()
         timeseries_form = QFormLayout(self.timeseries_widget)
         self.ts_id_edit = QLineEdit()
@@ -96,29 +147,19 @@ class AddEditReferenceDialog(QDialog):
         timeseries_form.addRow("Stored At (URI):", self.ts_stored_at_edit)
         self.stacked_widget.addWidget(self.timeseries_widget)
 
-        # --- Dialog Buttons ---
-        self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
-        self.layout.addWidget(self.button_box)
-
-        # --- Initialization ---
-        self.ref_data = None
-        if self.existing_ref:
-            self._load_existing_data()
-        else:
-            # Default selection
-            self.bacnet_option1_radio.setChecked(True)
-            self._update_form()  # Trigger initial form display
-
-        self.setMinimumWidth(400)
-
     def _load_existing_data(self):
+        # Populate silently, the form is refreshed once at the end
+        self.type_combo.blockSignals(True)
         ref_type = self.existing_ref.get("type")
         if ref_type == "BACnet":
             self.type_combo.setCurrentText("BACnet")
+            if self.bacnet_widget is None:
+                self._build_bacnet_widget()
+            self.bacnet_option1_radio.blockSignals(True)
+            self.bacnet_option2_radio.blockSignals(True)
             option = self.existing_ref.get("option", 1)  # Default to option 1 if missing
             if option == 1:
+                self._build_bacnet_opt1()
                 self.bacnet_option1_radio.setChecked(True)
                 self.bacnet_obj_id_edit.setText(self.existing_ref.get("object-identifier", ""))
                 self.bacnet_obj_name_edit.setText(self.existing_ref.get("object-name", ""))
@@ -127,29 +168,43 @@ class AddEditReferenceDialog(QDialog):
                 self.bacnet_prop_edit.setText(self.existing_ref.get("read-property", ""))
                 self.bacnet_obj_of_edit.setText(self.existing_ref.get("objectOf", ""))
             elif option == 2:
+                self._build_bacnet_opt2()
                 self.bacnet_option2_radio.setChecked(True)
                 self.bacnet_uri_edit.setText(self.existing_ref.get("BACnetURI", ""))
                 self.bacnet_obj_of_edit_opt2.setText(self.existing_ref.get("objectOf", ""))  # Load into correct field
+            self.bacnet_option1_radio.blockSignals(False)
+            self.bacnet_option2_radio.blockSignals(False)
 
         elif ref_type == "Timeseries":
             self.type_combo.setCurrentText("Timeseries")
+            if self.timeseries_widget is None:
+                self._build_timeseries()
             self.ts_id_edit.setText(self.existing_ref.get("timeseriesId", ""))
             self.ts_stored_at_edit.setText(self.existing_ref.get("storedAt", ""))
 
+        self.type_combo.blockSignals(False)
         self._update_form()  # Ensure correct form is visible
 
     def _update_form(self):
         selected_type = self.type_combo.currentData()
         if selected_type == "BACnet":
+            if self.bacnet_widget is None:
+                self._build_bacnet_widget()
             self.stacked_widget.setCurrentWidget(self.bacnet_widget)
             self._update_bacnet_options()  # Update BACnet sub-options
         elif selected_type == "Timeseries":
+            if self.timeseries_widget is None:
+                self._build_timeseries()
             self.stacked_widget.setCurrentWidget(self.timeseries_widget)
 
     def _update_bacnet_options(self):
         if self.bacnet_option1_radio.isChecked():
+            if self.bacnet_opt1_widget is None:
+                self._build_bacnet_opt1()
             self.bacnet_option_stack.setCurrentWidget(self.bacnet_opt1_widget)
         elif self.bacnet_option2_radio.isChecked():
+            if self.bacnet_opt2_widget is None:
+                self._build_bacnet_opt2()
             self.bacnet_option_stack.setCurrentWidget(self.bacnet_opt2_widget)
 
     def accept(self):
@@ -162,41 +217,42 @@ class AddEditReferenceDialog(QDialog):
         if selected_type == "BACnet":
             if self.bacnet_option1_radio.isChecked():
                 data['option'] = 1
-                obj_id = self.bacnet_obj_id_edit.text().strip()
+                obj_id = _field_text(self.bacnet_obj_id_edit)
                 if not obj_id:
                     QMessageBox.warning(self, "Input Error", "BACnet Object Identifier is required for Option 1.")
                     return
                 data['object-identifier'] = obj_id
-                data['object-name'] = self.bacnet_obj_name_edit.text().strip()
-                data['object-type'] = self.bacnet_obj_type_edit.text().strip()
-                data['description'] = self.bacnet_desc_edit.text().strip()
-                read_prop = self.bacnet_prop_edit.text().strip()
+                data['object-name'] = _field_text(self.bacnet_obj_name_edit)
+                data['object-type'] = _field_text(self.bacnet_obj_type_edit)
+                data['description'] = _field_text(self.bacnet_desc_edit)
+                read_prop = _field_text(self.bacnet_prop_edit)
                 if read_prop:  # Only include if not empty (defaults to present-value in schema)
                     data['read-property'] = read_prop
-                obj_of = self.bacnet_obj_of_edit.text().strip()
+                obj_of = _field_text(self.bacnet_obj_of_edit)
                 if obj_of: data['objectOf'] = obj_of
 
             elif self.bacnet_option2_radio.isChecked():
                 data['option'] = 2
-                uri = self.bacnet_uri_edit.text().strip()
+                uri = _field_text(self.bacnet_uri_edit)
                 if not uri or not uri.startswith("bacnet://"):
                     QMessageBox.warning(self, "Input Error",
                                         "A valid BACnet URI (starting with 'bacnet://') is required for Option 2.")
                     return
                 data['BACnetURI'] = uri
-                obj_of = self.bacnet_obj_of_edit_opt2.text().strip()  # Get from correct field
+                obj_of = _field_text(self.bacnet_obj_of_edit_opt2)  # Get from correct field
                 if obj_of: data['objectOf'] = obj_of
 
         elif selected_type == "Timeseries":
-            ts_id = self.ts_id_edit.text().strip()
+            ts_id = _field_text(self.ts_id_edit)
             if not ts_id:
                 QMessageBox.warning(self, "Input Error", "Timeseries ID is required.")
                 return
             data['timeseriesId'] = ts_id
-            stored_at = self.ts_stored_at_edit.text().strip()
+            stored_at = _field_text(self.ts_stored_at_edit)
             if stored_at:  # Technically optional in some contexts, but usually needed
                 data['storedAt'] = stored_at
 
+        _refresh_display(data)
         self.ref_data = data
         super().accept()  # Call QDialog's accept
 
@@ -213,6 +269,11 @@ class ExternalReferencesDialog(QDialog):
         self.point_item = point_item
         self.setWindowTitle(f"External References for {point_item.label or point_item.entity.name}")
 
+        self._setup_ui()
+        self._populate_list()
+        self.setMinimumSize(500, 300)
+
+    def _setup_ui(self):
         self.layout = QVBoxLayout(self)
 
         # List widget to display references
@@ -240,34 +301,15 @@ class ExternalReferencesDialog(QDialog):
 
         self.layout.addLayout(button_layout)
 
-        self._populate_list()
-        self.setMinimumSize(500, 300)
-
     def _populate_list(self):
         """Fill the list widget with current references."""
+        self.ref_list_widget.setUpdatesEnabled(False)
         self.ref_list_widget.clear()
         for ref in self.point_item.external_references:
-            item = QListWidgetItem(self._get_ref_display_text(ref))
+            item = QListWidgetItem(ref.get('_display') or _get_ref_display_text(ref))
             item.setData(Qt.UserRole, ref)  # Store the full dict
             self.ref_list_widget.addItem(item)
-
-    def _get_ref_display_text(self, ref_data):
-        """Generate a user-friendly string for the list."""
-        ref_type = ref_data.get("type", "Unknown")
-        details = ""
-        if ref_type == "BACnet":
-            option = ref_data.get("option", 0)
-            if option == 1:
-                details = f"BACnet (Fields): ID={ref_data.get('object-identifier', 'N/A')}"
-            elif option == 2:
-                details = f"BACnet (URI): {ref_data.get('BACnetURI', 'N/A')}"
-            else:
-                details = f"BACnet (Unknown Option)"
-        elif ref_type == "Timeseries":
-            details = f"Timeseries: ID={ref_data.get('timeseriesId', 'N/A')}"
-        else:
-            details = f"{ref_type}: ID={ref_data.get('id', 'N/A')}"
-        return details
+        self.ref_list_widget.setUpdatesEnabled(True)
 
     def _add_reference(self):
         """Open the AddEdit dialog to create a new reference."""
@@ -277,8 +319,11 @@ class ExternalReferencesDialog(QDialog):
             if new_ref_data:
                 # Add a unique internal ID if needed (helps with editing/deleting)
                 new_ref_data['id'] = str(uuid.uuid4())
+                _refresh_display(new_ref_data)
                 self.point_item.external_references.append(new_ref_data)
-                self._populate_list()  # Refresh the list
+                item = QListWidgetItem(new_ref_data['_display'])
+                item.setData(Qt.UserRole, new_ref_data)
+                self.ref_list_widget.addItem(item)
 
     def _edit_reference(self):
         """Open the AddEdit dialog to modify the selected reference."""
@@ -293,13 +338,11 @@ class ExternalReferencesDialog(QDialog):
         if dialog.exec_() == QDialog.Accepted:
             updated_ref_data = dialog.get_data()
             if updated_ref_data:
-                # Find and update the reference in the point_item's list
-                ref_id_to_update = existing_ref_data.get('id')
-                for i, ref in enumerate(self.point_item.external_references):
-                    if ref.get('id') == ref_id_to_update:
-                        self.point_item.external_references[i] = updated_ref_data
-                        break
-                self._populate_list()  # Refresh the list
+                # List rows mirror the point_item's references one to one
+                row = self.ref_list_widget.row(selected_item)
+                self.point_item.external_references[row] = updated_ref_data
+                selected_item.setText(updated_ref_data['_display'])
+                selected_item.setData(Qt.UserRole, updated_ref_data)
 
     def _delete_reference(self):
         """Delete the selected reference."""
@@ -313,12 +356,6 @@ class ExternalReferencesDialog(QDialog):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            ref_to_delete = selected_item.data(Qt.UserRole)
-            ref_id_to_delete = ref_to_delete.get('id')
-
-            # Remove by ID matching
-            self.point_item.external_references = [
-                ref for ref in self.point_item.external_references
-                if ref.get('id') != ref_id_to_delete
-            ]
-            self._populate_list()  # Refresh the list
+            row = self.ref_list_widget.row(selected_item)
+            self.ref_list_widget.takeItem(row)
+            del self.point_item.external_references[row]
@@ -2,8 +2,8 @@ import math
 import rdflib
 
 # PyQt imports
-from PyQt5.QtWidgets import QGraphicsItem, QGraphicsEllipseItem, QGraphicsPathItem, QGraphicsPolygonItem
-from PyQt5.QtCore import Qt, QPointF, QByteArray
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsEllipseItem, QGraphicsPathItem
+from PyQt5.QtCore import Qt, QPointF, QSizeF, QByteArray
 from PyQt5.QtGui import QPen, QBrush, QPainterPath, QPolygonF, QTransform
 from PyQt5.QtSvg import QSvgRenderer, QGraphicsSvgItem
 
@@ -14,21 +14,84 @@ from src.config import AppConfig
 from src.ontologies.namespaces import BLDG, short_uuid
 
 
+# Relationships that link equipment to its Points (drawn dashed, hidden with Points)
+HAS_POINT = rdflib.BRICK.hasPoint
+IS_POINT_OF = rdflib.BRICK.isPointOf
+POINT_RELATIONSHIPS = frozenset((HAS_POINT, IS_POINT_OF))
+
+
+def _snap(value: float, grid_size: int) -> float:
+    """Snap a coordinate to the nearest grid line."""
+    return (value + grid_size / 2) // grid_size * grid_size
+
+
+# Arrow shape: size and the angles of its base corners relative to the segment
+_ARROW_SIZE = 5
+_ARROW_ANGLE = math.pi / 4  # 45 degrees (wider angle = less pointy)
+_ARROW_LEFT = math.pi - _ARROW_ANGLE
+_ARROW_RIGHT = math.pi + _ARROW_ANGLE
+
+
+def _arrow_vertices(coords):
+    """Return the (left, tip, right) corners of the arrow on each segment of a polyline."""
+
+    arrow_size = _ARROW_SIZE
+    left_offset = _ARROW_LEFT
+    right_offset = _ARROW_RIGHT
+    cos, sin, atan2 = math.cos, math.sin, math.atan2
+
+    vertices = []
+    for (start_x, start_y), (end_x, end_y) in zip(coords, coords[1:]):
+        # Calculate arrow position and orientation
+        middle_x = (start_x + end_x) / 2
+        middle_y = (start_y + end_y) / 2
+        angle = atan2(end_y - start_y, end_x - start_x)
+
+        # Tip points toward the end point, base corners spread behind it
+        vertices.append((
+            middle_x + arrow_size * cos(angle + left_offset),
+            middle_y + arrow_size * sin(angle + left_offset),
+            middle_x + arrow_size * cos(angle),
+            middle_y + arrow_size * sin(angle),
+            middle_x + arrow_size * cos(angle + right_offset),
+            middle_y + arrow_size * sin(angle + right_offset),
+        ))
+
+    return vertices
+
+
 class EntityItem(QGraphicsSvgItem):
     """Graphical representation of an entity in the canvas."""
 
+    # Shared (renderer, default size) per entity SVG, parsed once
+    _renderer_cache: dict[str, tuple[QSvgRenderer, QSizeF]] = {}
+
+    @classmethod
+    def shared_renderer(cls, entity) -> tuple[QSvgRenderer, QSizeF]:
+        """Return the SVG renderer and its default size shared by all items of an entity."""
+        cached = cls._renderer_cache.get(entity.svg_data)
+        if cached is None:
+            renderer = QSvgRenderer(QByteArray(entity.svg_data.encode()))
+            cached = cls._renderer_cache[entity.svg_data] = (renderer, QSizeF(renderer.defaultSize()))
+        return cached
+
     def __init__(self, uri_ref: rdflib.URIRef | str):
         self.entity = EntityLibrary.find_entity_by_uri(uri_ref)
 
-        # Generate a unique instance URI
-        self.instance_uri = BLDG[short_uuid()]
+        # Unique instance URI, generated on first use (see instance_uri)
+        self._instance_uri = None
         self.label = ""
         self.external_reference: dict | None = None
 
-        # Create SVG renderer
-        self.renderer = QSvgRenderer(QByteArray(self.entity.svg_data.encode()))
+        # Use the shared SVG renderer of this entity type
+        self.renderer, self.svg_size = EntityItem.shared_renderer(self.entity)
         super().__init__()
 
+        # Snapping and rotation pivot around the SVG center
+        self._cx = self.svg_size.width() / 2
+        self._cy = self.svg_size.height() / 2
+        self.is_point = isinstance(self.entity, Point)
+
         self.setSharedRenderer(self.renderer)
         self.setFlags(
             QGraphicsItem.ItemIsMovable |
@@ -40,44 +103,51 @@ class EntityItem(QGraphicsSvgItem):
 
         # Track rotation
         self.rotation_angle = 0
+        self._rotation_transform = QTransform()
 
         # Create connection port
         self.port = PortItem(self)
         self.port.setPos(*self.entity.port_pos)
 
+    @property
+    def instance_uri(self) -> rdflib.URIRef:
+        # Loaded items get their URI assigned, so only generate one when needed
+        if self._instance_uri is None:
+            self._instance_uri = BLDG[short_uuid()]
+        return self._instance_uri
+
+    @instance_uri.setter
+    def instance_uri(self, uri: rdflib.URIRef):
+        self._instance_uri = uri
+
     def itemChange(self, change, value):
+        # Snapped positions equal to the current one are dropped by Qt (see JointItem)
         if change == QGraphicsItem.ItemPositionChange and self.scene():
             return self._handle_position_change(value)
 
-        elif change == QGraphicsItem.ItemPositionHasChanged and self.scene():
-            self.port.update_connections()
+        elif change == QGraphicsItem.ItemPositionHasChanged:
+            self.port.invalidate_scene_pos()
+            if self.scene():
+                self.port.update_connections()
 
         return super().itemChange(change, value)
 
     def _handle_position_change(self, new_pos):
 
         grid_size = AppConfig.grid_size
-        point_line_y = AppConfig.get_point_line_height()
-
-        # Get SVG dimensions
-        svg_width = self.renderer.defaultSize().width()
-        svg_height = self.renderer.defaultSize().height()
-
-        # Calculate center offset
-        center_x = svg_width / 2
-        center_y = svg_height / 2
+        center_x = self._cx
+        center_y = self._cy
 
         # Snap to grid using center point
-        x = round((new_pos.x() + center_x) / grid_size) * grid_size - center_x
+        x = _snap(new_pos.x() + center_x, grid_size) - center_x
 
         # Check if this is a Point entity and constrain to the line
-        is_point = isinstance(self.entity, Point)
-        if is_point:
+        if self.is_point:
             # For Point entities, Y coordinate is fixed to the line
-            y = point_line_y - center_y
+            y = AppConfig.get_point_line_height() - center_y
         else:
             # For other entities, use regular grid snapping
-            y = round((new_pos.y() + center_y) / grid_size) * grid_size - center_y
+            y = _snap(new_pos.y() + center_y, grid_size) - center_y
 
         return QPointF(x, y)
 
@@ -86,19 +156,18 @@ class EntityItem(QGraphicsSvgItem):
 
         self.rotation_angle = angle % 360
 
-        # Get SVG center
-        center_x = self.renderer.defaultSize().width() / 2
-        center_y = self.renderer.defaultSize().height() / 2
+        center_x = self._cx
+        center_y = self._cy
 
-        # Reset transform and apply rotation
-        self.setTransform(QTransform())
-
-        transform = QTransform()
+        # Rebuild the rotation around the center (setTransform copies it)
+        transform = self._rotation_transform
+        transform.reset()
         transform.translate(center_x, center_y)
         transform.rotate(self.rotation_angle)
         transform.translate(-center_x, -center_y)
 
         self.setTransform(transform)
+        self.port.invalidate_scene_pos()
         self.port.update_connections()
 
         return self
@@ -137,12 +206,13 @@ class PortItem(QGraphicsEllipseItem):
     HOVER_BRUSH = QBrush(Qt.darkGray)
 
     def __init__(self, parent: EntityItem):
-        super().__init__(-4, -4, 8, 8, parent)
+        # The rect always has the hover size, the drawn size changes in paint()
+        radius = self.HOVER_RADIUS
+        super().__init__(-radius, -radius, 2 * radius, 2 * radius, parent)
 
         self.setAcceptHoverEvents(True)
 
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
-        self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
 
         self.setPen(QPen(Qt.black, 1))
         self.setBrush(QBrush(Qt.gray))
@@ -153,6 +223,7 @@ class PortItem(QGraphicsEllipseItem):
         self.entity_item: EntityItem = parent
 
         self._is_hovered = False
+        self._scene_pos = None
 
     def hoverEnterEvent(self, event):
         self.setHovered(True)
@@ -169,20 +240,37 @@ class PortItem(QGraphicsEllipseItem):
 
         self._is_hovered = hovered
         if hovered:
-            radius = self.HOVER_RADIUS
             self.setBrush(self.HOVER_BRUSH)  # Use hover brush
             self.setZValue(3)  # Bring hovered port slightly more forward if needed
         else:
-            radius = self.NORMAL_RADIUS
             self.setBrush(self.DEFAULT_BRUSH)  # Use default brush
             self.setZValue(2)  # Reset Z value
 
-        # Update the bounding rectangle to change size
-        self.setRect(-radius, -radius, 2 * radius, 2 * radius)
+    def _radius(self):
+        return self.HOVER_RADIUS if self._is_hovered else self.NORMAL_RADIUS
+
+    def shape(self):
+        path = QPainterPath()
+        radius = self._radius()
+        path.addEllipse(QPointF(0, 0), radius, radius)
+        return path
+
+    def paint(self, painter, option, widget=None):
+        radius = self._radius()
+        painter.setPen(self.pen())
+        painter.setBrush(self.brush())
+        painter.drawEllipse(QPointF(0, 0), radius, radius)
 
     def scenePos(self):
         """Get the global scene position of the port."""
-        return self.mapToScene(self.boundingRect().center())
+        # The port rect is centered on its origin, so hovering never moves the center
+        if self._scene_pos is None:
+            self._scene_pos = self.mapToScene(0, 0)
+        return self._scene_pos
+
+    def invalidate_scene_pos(self):
+        """Drop the cached scene position after the entity moved or rotated."""
+        self._scene_pos = None
 
     def add_connection(self, connection):
         """Register a connection with this port."""
@@ -208,7 +296,7 @@ class JointItem(QGraphicsEllipseItem):
 
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
 
         self.setPen(QPen(Qt.black, 1))
         self.setBrush(QBrush(Qt.black))
@@ -217,6 +305,8 @@ class JointItem(QGraphicsEllipseItem):
         self.connection = parent
 
     def itemChange(self, change, value):
+        # Qt drops the change (and ItemPositionHasChanged) when the snapped
+        # position equals the current one, so updates only fire per grid step
         if change == QGraphicsItem.ItemPositionChange and self.scene():
             return self._snap_to_grid(value)
         elif change == QGraphicsItem.ItemPositionHasChanged and self.scene():
@@ -230,8 +320,8 @@ class JointItem(QGraphicsEllipseItem):
         grid_size = AppConfig.grid_size
 
         # Snap to grid
-        x = round(new_pos.x() / grid_size) * grid_size
-        y = round(new_pos.y() / grid_size) * grid_size
+        x = _snap(new_pos.x(), grid_size)
+        y = _snap(new_pos.y(), grid_size)
 
         return QPointF(x, y)
 
@@ -239,6 +329,8 @@ class JointItem(QGraphicsEllipseItem):
 class ConnectionItem(QGraphicsPathItem):
     """A connection between two ports with directional arrows and joints."""
 
+    DEFAULT_PEN = QPen(Qt.black, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+
     def __init__(
             self,
             source_port: PortItem,
@@ -251,11 +343,17 @@ class ConnectionItem(QGraphicsPathItem):
         self.source_port = source_port
         self.target_port = target_port
         self.joints = []
-        self.arrows = []
 
-        self.setPen(QPen(Qt.black, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        # Arrowheads are kept as closed sub-paths and drawn by paint()
+        self._arrow_path = QPainterPath()
+        self._last_geometry = None
+        # Line and arrow bounds, rebuilt on the next boundingRect() after a path or pen change
+        self._bounding_rect = None
+
+        self.setPen(self.DEFAULT_PEN)
         self.setZValue(0.5)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # Register with ports
         if source_port:
@@ -263,8 +361,8 @@ class ConnectionItem(QGraphicsPathItem):
         if target_port:
             target_port.add_connection(self)
 
-        # Create unique relationship URI
-        self.instance_uri = BLDG[short_uuid()]
+        # Unique relationship URI, generated on first use (see instance_uri)
+        self._instance_uri = None
 
         # Set default relationship type
         if relationship_type is None:
@@ -274,119 +372,105 @@ class ConnectionItem(QGraphicsPathItem):
 
         self.update_position()
 
+    @property
+    def instance_uri(self) -> rdflib.URIRef:
+        # Loaded items get their URI assigned, so only generate one when needed
+        if self._instance_uri is None:
+            self._instance_uri = BLDG[short_uuid()]
+        return self._instance_uri
+
+    @instance_uri.setter
+    def instance_uri(self, uri: rdflib.URIRef):
+        self._instance_uri = uri
+
     def update_position(self):
         """Update the connection path based on port positions and joints."""
         if not self.source_port:
             return
 
-        # Get source position
-        source_pos = self.source_port.scenePos()
-
-        # Clear existing arrows
-        self._clear_arrows()
-
         # Draw complete path if target exists, or temporary path if in creation mode
         if self.target_port:
-            self._draw_complete_path(source_pos, self.target_port.scenePos())
-
+            end_pos = self.target_port.scenePos()
         elif hasattr(self, 'current_end_pos'):
-            self._draw_temp_path(source_pos, self.current_end_pos)
-
-    def _clear_arrows(self):
-        """Remove all arrow indicators from the scene."""
-        for arrow in self.arrows:
-            if arrow.scene():
-                arrow.scene().removeItem(arrow)
-        self.arrows.clear()
+            end_pos = self.current_end_pos
+        else:
+            return
 
-    def _draw_complete_path(self, source_pos, target_pos):
-        """Draw a complete path with arrows from source to target through joints."""
         # Collect all points in order
-        points = [source_pos] + [joint.scenePos() for joint in self.joints] + [target_pos]
+        points = [self.source_port.scenePos()] + [joint.scenePos() for joint in self.joints] + [end_pos]
 
-        # Create path through all points
-        path = QPainterPath()
-        path.moveTo(source_pos)
-
-        # Draw segments and add arrows
-        for i in range(1, len(points)):
-            start_point = points[i - 1]
-            end_point = points[i]
+        # Skip the rebuild when nothing moved since the last one
+        coords = tuple((point.x(), point.y()) for point in points)
+        geometry = (self.target_port is not None, coords)
+        if geometry == self._last_geometry:
+            return
+        self._last_geometry = geometry
 
-            path.lineTo(end_point)
-            self._add_arrow_to_segment(start_point, end_point)
+        if self.target_port:
+            self._draw_complete_path(points, coords)
+        else:
+            self._draw_temp_path(points, coords)
 
-        self.setPath(path)
+    def _draw_complete_path(self, points, coords):
+        """Draw a complete path with arrows from source to target through joints."""
+        self._set_paths(self._build_line_path(points), self._build_arrow_path(coords))
 
-    def _draw_temp_path(self, source_pos, end_pos):
+    def _draw_temp_path(self, points, coords):
         """Draw a temporary path during connection creation."""
-        # Collect all points in order
-        points = [source_pos] + [joint.scenePos() for joint in self.joints] + [end_pos]
-
-        # Create path through all points
-        path = QPainterPath()
-        path.moveTo(source_pos)
-
-        # Draw segments and add arrows to all except last segment
-        for i in range(1, len(points)):
-            start_point = points[i - 1]
-            end_point = points[i]
-
-            path.lineTo(end_point)
-
-            # Only add arrows to completed segments (not to temporary end segment)
-            if i < len(points) - 1 or self.target_port:
-                self._add_arrow_to_segment(start_point, end_point)
-
+        # Only add arrows to completed segments (not to temporary end segment)
+        self._set_paths(self._build_line_path(points), self._build_arrow_path(coords[:-1]))
+
+    def _set_paths(self, path, arrow_path):
+        """Replace the line and arrow geometry of the connection."""
+        self.prepareGeometryChange()
+        self._arrow_path = arrow_path
+        self._bounding_rect = None
         self.setPath(path)
 
-    def _add_arrow_to_segment(self, start_point, end_point):
-        """Add a directional arrow in the middle of a line segment."""
-        # Calculate arrow position and orientation
-
-        middle_x = (start_point.x() + end_point.x()) / 2
-        middle_y = (start_point.y() + end_point.y()) / 2
-
-        angle = math.atan2(end_point.y() - start_point.y(),
-                           end_point.x() - start_point.x())
-
-        # Define arrow shape
-        arrow_size = 5
-        arrow_angle = math.pi / 4  # 45 degrees (wider angle = less pointy)
-
-        # Point2 should be the tip of the arrow pointing toward the end point
-        point2 = QPointF(
-            middle_x + arrow_size * math.cos(angle),
-            middle_y + arrow_size * math.sin(angle)
-        )
-
-        # Calculate arrowhead base points with wider angle
-        point1 = QPointF(
-            middle_x + arrow_size * math.cos(angle + math.pi - arrow_angle),
-            middle_y + arrow_size * math.sin(angle + math.pi - arrow_angle)
-        )
-
-        point3 = QPointF(
-            middle_x + arrow_size * math.cos(angle + math.pi + arrow_angle),
-            middle_y + arrow_size * math.sin(angle + math.pi + arrow_angle)
-        )
-
-        # Create arrow polygon
-        polygon = QPolygonF([point1, point2, point3])
-        arrow = QGraphicsPolygonItem(polygon)
-
-        # Match arrow style to connection
-        arrow.setBrush(QBrush(self.pen().color()))
-        arrow.setPen(self.pen())
-
-        # Add to scene
-        if self.scene():
-            self.scene().addItem(arrow)
-
-        # Store reference
-        self.arrows.append(arrow)
-
-        return arrow
+    @staticmethod
+    def _build_line_path(points):
+        """Create the polyline through all points."""
+        path = QPainterPath()
+        path.addPolygon(QPolygonF(points))
+        return path
+
+    @staticmethod
+    def _build_arrow_path(coords):
+        """Create one directional arrow in the middle of every segment."""
+        arrow_path = QPainterPath()
+        for left_x, left_y, tip_x, tip_y, right_x, right_y in _arrow_vertices(coords):
+            arrow_path.moveTo(left_x, left_y)
+            arrow_path.lineTo(tip_x, tip_y)
+            arrow_path.lineTo(right_x, right_y)
+            arrow_path.closeSubpath()
+        return arrow_path
+
+    def setPen(self, pen):
+        # The pen width widens the bounds
+        super().setPen(pen)
+        self._bounding_rect = None
+
+    def boundingRect(self):
+        # Qt asks on every paint, index lookup and hit test
+        rect = self._bounding_rect
+        if rect is None:
+            rect = super().boundingRect()
+            if not self._arrow_path.isEmpty():
+                half_width = self.pen().widthF() / 2
+                rect = rect.united(
+                    self._arrow_path.boundingRect().adjusted(-half_width, -half_width, half_width, half_width)
+                )
+            self._bounding_rect = rect
+        return rect
+
+    def paint(self, painter, option, widget=None):
+        super().paint(painter, option, widget)
+
+        # Arrows match the line style and are filled with its color
+        pen = self.pen()
+        painter.setPen(pen)
+        painter.setBrush(pen.color())
+        painter.drawPath(self._arrow_path)
 
     def set_current_end_pos(self, pos):
         """Set temporary end position during connection creation."""
@@ -416,15 +500,9 @@ class ConnectionItem(QGraphicsPathItem):
         if self.target_port:
             self.target_port.remove_connection(self)
 
-        # Remove joints
-        for joint in self.joints:
-            if joint.scene():
-                joint.scene().removeItem(joint)
+        # Joints are child items and leave the scene together with the connection
         self.joints.clear()
 
-        # Remove arrows
-        self._clear_arrows()
-
         # Remove from scene
         if self.scene():
             self.scene().removeItem(self)
@@ -437,7 +515,20 @@ class ConnectionItem(QGraphicsPathItem):
         self.source_port = target
         self.target_port = source
 
-        self.update_position()
+        # Walk the joints from the new source so the line keeps its route
+        self.joints.reverse()
+
+        if not (target and self._last_geometry and self._last_geometry[0]):
+            self.update_position()
+            return
+
+        # The polyline is unchanged, only the arrows have to point the other way
+        coords = self._last_geometry[1][::-1]
+        self._last_geometry = (True, coords)
+        self.prepareGeometryChange()
+        self._arrow_path = self._build_arrow_path(coords)
+        self._bounding_rect = None
+        self.update()
 
     def set_relationship_type(self, rel_type):
         """Set the semantic relationship type for this connection with visual styling."""
@@ -445,24 +536,19 @@ class ConnectionItem(QGraphicsPathItem):
         self.relationship_type = rel_type
 
         # Determine line style based on relationship type
-        if rel_type == rdflib.BRICK.hasPoint or rel_type == rdflib.BRICK.isPointOf:
+        if rel_type in POINT_RELATIONSHIPS:
             line_style = Qt.DashLine
         else:
             line_style = Qt.SolidLine
 
-        # Create new pen with appropriate style
-        current_pen = self.pen()
-        new_pen = QPen(current_pen)
-        new_pen.setStyle(line_style)
-
-        # Apply new pen to connection
-        self.setPen(new_pen)
+        # Keep the current pen (and its color) if the style already matches
+        pen = self.pen()
+        if pen.style() == line_style:
+            return
 
-        # Update arrow styles to match
-        current_color = current_pen.color()
-        for arrow in self.arrows:
-            arrow.setPen(new_pen)
-            arrow.setBrush(QBrush(current_color))
+        # Apply new style to connection and its arrows
+        pen.setStyle(line_style)
+        self.setPen(pen)
 
     def get_source_entity_uri(self):
         """Get the source entity instance URI."""
@@ -484,15 +570,12 @@ class ConnectionItem(QGraphicsPathItem):
         grid_size = AppConfig.grid_size
 
         # Snap position to grid
-        x = round(scene_pos.x() / grid_size) * grid_size
-        y = round(scene_pos.y() / grid_size) * grid_size
+        x = _snap(scene_pos.x(), grid_size)
+        y = _snap(scene_pos.y(), grid_size)
 
+        # As a child item the joint follows the connection into the scene
         joint.setPos(QPointF(x, y))
 
-        # Add to scene
-        if self.scene():
-            self.scene().addItem(joint)
-
         # Add to joints list
         self.joints.append(joint)
 
@@ -500,3 +583,14 @@ class ConnectionItem(QGraphicsPathItem):
         self.update_position()
 
         return joint
+
+    def remove_joints(self, joints):
+        """Remove several joints at once, keeping the order of the remaining ones."""
+
+        joints = set(joints)
+        self.joints = [joint for joint in self.joints if joint not in joints]
+
+        scene = self.scene()
+        for joint in joints:
+            if scene:
+                scene.removeItem(joint)
@@ -1,48 +1,168 @@
+import contextlib
+import functools
+import itertools
+import math
 import uuid
 import rdflib
 
 # PyQt imports
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem,
-    QGraphicsView, QGraphicsScene, QMessageBox, QColorDialog,
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QMessageBox, QColorDialog,
     QComboBox, QFormLayout, QLineEdit, QPushButton, QGroupBox,
 )
 from PyQt5.QtCore import (
-    Qt, QRectF, QPointF, pyqtSignal, QByteArray, QMimeData, QPoint
+    Qt, QRectF, QPointF, pyqtSignal, QByteArray, QMimeData, QPoint, QTimer
 )
 from PyQt5.QtGui import (
-    QPen, QBrush, QColor, QIcon, QPixmap, QPainter, QDrag, QTransform
+    QPen, QColor, QIcon, QPixmap, QPixmapCache, QPainter, QPainterPath, QDrag, QTransform
 )
-from PyQt5.QtSvg import QSvgRenderer
 
 # Local imports
-from src.model import EntityLibrary, Point
-from src.app.items import EntityItem, ConnectionItem, PortItem, JointItem
+from src.model import EntityLibrary
+from src.app.items import (
+    EntityItem, ConnectionItem, PortItem, JointItem, HAS_POINT, IS_POINT_OF, POINT_RELATIONSHIPS
+)
 from src.config import AppConfig
 from src.logging import Logger
 from src.app.dialogs import ExternalReferencesDialog
 from src.ifc import extract_topology
 from src.ontologies.namespaces import RDF, BLDG, REC, BRICK, BRICK_REF, VISU, BACNET, bind_namespaces, short_uuid
 
-# Ontology namespace definitions
-BRICK_RELATIONSHIPS = {
-    "hasLocation": rdflib.BRICK.hasLocation,
-    "isLocationOf": rdflib.BRICK.isLocationOf,
-    "feeds": rdflib.BRICK.feeds,
-    "isFedBy": rdflib.BRICK.isFedBy,
-    "hasPoint": rdflib.BRICK.hasPoint,
-    "isPointOf": rdflib.BRICK.isPointOf,
-    "hasPart": rdflib.BRICK.hasPart,
-    "isPartOf": rdflib.BRICK.isPartOf,
-}
+# Ontology relationship definitions, in the order shown in the UI
+BRICK_RELATIONSHIPS_ITEMS = (
+    ("hasLocation", rdflib.BRICK.hasLocation),
+    ("isLocationOf", rdflib.BRICK.isLocationOf),
+    ("feeds", rdflib.BRICK.feeds),
+    ("isFedBy", rdflib.BRICK.isFedBy),
+    ("hasPoint", rdflib.BRICK.hasPoint),
+    ("isPointOf", rdflib.BRICK.isPointOf),
+    ("hasPart", rdflib.BRICK.hasPart),
+    ("isPartOf", rdflib.BRICK.isPartOf),
+)
+BRICK_RELATIONSHIPS = dict(BRICK_RELATIONSHIPS_ITEMS)  # Name -> URI lookup
+
+# Reverse lookup of relationship names, keyed by URI string
+BRICK_RELATIONSHIP_NAMES = {str(rel_uri): rel_name for rel_name, rel_uri in BRICK_RELATIONSHIPS_ITEMS}
+
+# Relationship combo box contents: names, URIs by index and index by URI
+_REL_COMBO_NAMES = [rel_name for rel_name, _ in BRICK_RELATIONSHIPS_ITEMS]
+_REL_COMBO_URIS = tuple(rel_uri for _, rel_uri in BRICK_RELATIONSHIPS_ITEMS)
+_REL_COMBO_INDEX = {rel_uri: i for i, rel_uri in enumerate(_REL_COMBO_URIS)}
+
+# Entity types are imported from these namespaces only
+_ENTITY_NAMESPACES = (str(BRICK), str(REC))
+
+# Visualization terms, built once (every Namespace attribute access creates a new URIRef)
+_VISU_CONNECTION = VISU.Connection
+_VISU_HAS_POSITION = VISU.hasPosition
+_VISU_X = VISU.x
+_VISU_Y = VISU.y
+_VISU_ROTATION = VISU.rotation
+_VISU_SOURCE_ENTITY = VISU.sourceEntity
+_VISU_TARGET_ENTITY = VISU.targetEntity
+_VISU_RELATIONSHIP_TYPE = VISU.relationshipType
+_VISU_COLOR = VISU.color
+_VISU_RED = VISU.red
+_VISU_GREEN = VISU.green
+_VISU_BLUE = VISU.blue
+_VISU_LINE_STYLE = VISU.lineStyle
+_VISU_LINE_WIDTH = VISU.lineWidth
+_VISU_HAS_JOINT = VISU.hasJoint
+_VISU_JOINT_INDEX = VISU.jointIndex
+
+# Standard RDF terms, built once (DefinedNamespace attribute access also builds a new URIRef)
+_RDF_TYPE = rdflib.RDF.type
+_RDFS_LABEL = rdflib.RDFS.label
+_XSD_INTEGER = rdflib.XSD.integer
+_XSD_FLOAT = rdflib.XSD.float
+_XSD_STRING = rdflib.XSD.string
+_REF_HAS_EXTERNAL_REFERENCE = BRICK_REF.hasExternalReference
+
+
+@functools.lru_cache(maxsize=1024)
+def _int_literal(value: int) -> rdflib.Literal:
+    """xsd:integer literal; rotations, colour channels and styles repeat a lot on save."""
+    return rdflib.Literal(value, datatype=_XSD_INTEGER)
+
+
+# Predicates read on import, with a single value per subject or with several objects
+_IMPORT_VALUE_PREDICATES = (
+    _VISU_X, _VISU_Y, _VISU_ROTATION, _RDFS_LABEL,
+    _VISU_SOURCE_ENTITY, _VISU_TARGET_ENTITY, _VISU_RELATIONSHIP_TYPE,
+    _VISU_RED, _VISU_GREEN, _VISU_BLUE, _VISU_LINE_STYLE, _VISU_LINE_WIDTH, _VISU_JOINT_INDEX,
+)
+_IMPORT_OBJECTS_PREDICATES = (_VISU_HAS_POSITION, _VISU_COLOR, _VISU_HAS_JOINT, _REF_HAS_EXTERNAL_REFERENCE)
+
+
+def _index_graph(g: rdflib.Graph):
+    """Collect rdf:type pairs, the import predicates and the Brick relationships of a graph in a single pass."""
+    types = []
+    values = {predicate: {} for predicate in _IMPORT_VALUE_PREDICATES}
+    objects = {predicate: {} for predicate in _IMPORT_OBJECTS_PREDICATES}
+    relationships = {rel_uri: [] for _, rel_uri in BRICK_RELATIONSHIPS_ITEMS}
+    rdf_type = _RDF_TYPE
+
+    for subject, predicate, obj in g:
+        if predicate == rdf_type:
+            types.append((subject, obj))
+            continue
+
+        subject_values = values.get(predicate)
+        if subject_values is not None:
+            subject_values.setdefault(subject, obj)  # Keep the first value, like Graph.value
+            continue
+
+        subject_objects = objects.get(predicate)
+        if subject_objects is not None:
+            subject_objects.setdefault(subject, []).append(obj)
+            continue
+
+        related = relationships.get(predicate)
+        if related is not None:
+            related.append((subject, obj))
+
+    return types, values, objects, relationships
+
+
+def _render_entity_pixmap(entity, size: int = 24) -> QPixmap:
+    """Render an entity's SVG into a square pixmap, reused through QPixmapCache."""
+    key = f"svg:{hash(entity.svg_data)}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        # Reuse the shared renderer of the entity's items instead of parsing the SVG again
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        renderer, _ = EntityItem.shared_renderer(entity)
+        renderer.render(painter)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+
+    return pixmap
+
+
+def _render_entity_icon(entity) -> QIcon:
+    """Render an entity's SVG into a 24x24 icon, shared by entities with the same SVG."""
+    return QIcon(_render_entity_pixmap(entity))
 
 
 class PropertyPanel(QWidget):
     """Panel for viewing and editing properties of selected entities and connections."""
 
+    relationship_type_changed = pyqtSignal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_selection = []
+        # Entities and connections of the current selection, split once per update
+        self._current_entities = []
+        self._current_connections = []
+        # Distinct labels and relationship types of the current selection
+        self._current_labels = set()
+        self._current_rel_types = set()
+        # Connection color dialog, created on first use and then reused
+        self._color_dialog = None
         self._setup_ui()
 
     @property
@@ -175,7 +295,20 @@ class PropertyPanel(QWidget):
 
         layout.addWidget(self.entity_widget)  # Add the entity group widget
 
-        # --- Relationship Form Group ---
+        # --- Relationship Form Group (built on first connection selection) ---
+        self.relationship_widget = None
+
+        # Hide forms initially
+        self.entity_widget.setVisible(False)
+
+        layout.addStretch(1)
+        self.setMinimumWidth(300)  # Increase minimum width slightly
+
+    def _ensure_relationship_form(self):
+        """Build the relationship form the first time a connection is shown."""
+        if self.relationship_widget is not None:
+            return
+
         self.relationship_widget = QWidget()  # Container for relationship fields
         self.relationship_form = QFormLayout(self.relationship_widget)
         self.relationship_form.setContentsMargins(0, 0, 0, 0)  # Optional: remove padding
@@ -202,8 +335,11 @@ class PropertyPanel(QWidget):
 
         # Relationship type dropdown
         self.rel_type_combo = QComboBox()
-        for rel_name, rel_uri in BRICK_RELATIONSHIPS.items():
-            self.rel_type_combo.addItem(rel_name, rel_uri)
+        self.rel_type_combo.addItems(_REL_COMBO_NAMES)
+        for i, rel_uri in enumerate(_REL_COMBO_URIS):
+            self.rel_type_combo.setItemData(i, rel_uri)
+        self._combo_uris = _REL_COMBO_URIS  # Combo index -> relationship URI
+        self._rel_uri_to_index = _REL_COMBO_INDEX  # Relationship URI -> combo index
         self.rel_type_combo.currentIndexChanged.connect(self._update_relationship_type)
         self.relationship_form.addRow(QLabel("<b>Type:</b>"), self.rel_type_combo)
 
@@ -217,19 +353,14 @@ class PropertyPanel(QWidget):
         self.color_button.clicked.connect(self._choose_connection_color)
         self.relationship_form.addRow(QLabel("<b>Color:</b>"), self.color_button)
 
-        layout.addWidget(self.relationship_widget)  # Add the relationship group widget
-
-        # Hide forms initially
-        self.relationship_widget.setVisible(False)
-        self.entity_widget.setVisible(False)
-
-        layout.addStretch(1)
-        self.setMinimumWidth(300)  # Increase minimum width slightly
+        # Add the relationship group widget right below the entity form
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(self.entity_widget) + 1, self.relationship_widget)
 
     def _update_entity_label(self):
         """Update the label of the selected entity."""
         # Only allow editing if a single item is selected
-        if len(self.current_selection) == 1 and isinstance(self.current_item, EntityItem):
+        if len(self.current_selection) == 1 and type(self.current_item) is EntityItem:
             new_label = self.label_edit.text()
             self.current_item.label = new_label
 
@@ -239,13 +370,17 @@ class PropertyPanel(QWidget):
         self.external_ref_group.setVisible(False)  # Also hide the ref group
 
     def _show_entity_form(self):
+        self._hide_relationship_form()  # Only one form is visible at a time
         self.entity_widget.setVisible(True)
         # Button visibility is handled separately in update_properties
 
     def _hide_relationship_form(self):
-        self.relationship_widget.setVisible(False)
+        if self.relationship_widget is not None:
+            self.relationship_widget.setVisible(False)
 
     def _show_relationship_form(self):
+        self._ensure_relationship_form()
+        self._hide_entity_form()  # Only one form is visible at a time
         self.relationship_widget.setVisible(True)
 
     # --- END REVISED Show/Hide Logic ---
@@ -254,14 +389,34 @@ class PropertyPanel(QWidget):
         """Update the properties panel with the selected items' information."""
         self.current_selection = items if items else []
 
+        # Bucket the selection by type and collect its labels and relationship types in a single pass
+        entities, connections = [], []
+        labels, rel_types = set(), set()
+        for item in self.current_selection:
+            item_type = type(item)
+            if item_type is EntityItem:
+                entities.append(item)
+                labels.add(item.label)
+            elif item_type is ConnectionItem:
+                connections.append(item)
+                rel_types.add(item.relationship_type)
+        self._current_entities, self._current_connections = entities, connections
+        self._current_labels, self._current_rel_types = labels, rel_types
+
+        # Suspend repaints so all field changes below are painted once
+        self.setUpdatesEnabled(False)
+        try:
+            self._refresh_properties()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _refresh_properties(self):
+        """Fill the forms from the current selection."""
         # Block signals during update to prevent premature data writes
         self._block_all_ref_signals(True)
 
-        # Hide all forms initially
-        self._hide_entity_form()
-        self._hide_relationship_form()
-        # external_ref_group is hidden by _hide_entity_form
-
+        # Each branch shows its own form and hides the other one, so the
+        # visible form is not hidden and shown again on every update
         if not self.current_selection:
             self.selection_count_label.setText("No items selected")
             self._show_entity_form()
@@ -276,9 +431,6 @@ class PropertyPanel(QWidget):
             self._block_all_ref_signals(False)  # Unblock signals
             return
 
-        entity_count = sum(1 for item in self.current_selection if isinstance(item, EntityItem))
-        connection_count = sum(1 for item in self.current_selection if isinstance(item, ConnectionItem))
-
         if len(self.current_selection) == 1:
             self.selection_count_label.setText("1 item selected")
         else:
@@ -288,20 +440,25 @@ class PropertyPanel(QWidget):
         self.external_ref_group.setVisible(False)
 
         if len(self.current_selection) > 1:
-            self._handle_multiple_selection(entity_count, connection_count)
+            self._handle_multiple_selection(
+                self._current_entities, self._current_connections, self._current_labels, self._current_rel_types
+            )
         else:
             # Handle single item selection
             item = self.current_item
-            if isinstance(item, EntityItem):
+            if type(item) is EntityItem:
                 self._update_entity_properties(item)  # Handles showing entity form
                 # Show/hide reference section based on type
-                if isinstance(item.entity, Point):
+                if item.is_point:
                     self.external_ref_group.setVisible(True)
                     self._load_external_ref_data(item)  # Load existing data
                 else:
                     self.external_ref_group.setVisible(False)
-            elif isinstance(item, ConnectionItem):
+            elif type(item) is ConnectionItem:
                 self._update_connection_properties(item)  # Handles showing relationship form
+            else:
+                self._hide_entity_form()
+                self._hide_relationship_form()
 
         self._block_all_ref_signals(False)  # Unblock signals after updates
 
@@ -360,8 +517,8 @@ class PropertyPanel(QWidget):
 
     def _update_external_ref_data(self):
         """Updates the external_reference dictionary on the selected Point item."""
-        if len(self.current_selection) != 1 or not isinstance(self.current_item, EntityItem) or not isinstance(
-                self.current_item.entity, Point):
+        if len(self.current_selection) != 1 or type(self.current_item) is not EntityItem or \
+                not self.current_item.is_point:
             return  # Only act on a single selected Point
 
         item = self.current_item
@@ -426,28 +583,25 @@ class PropertyPanel(QWidget):
         self.bacnet_uri_edit.blockSignals(block)
         self.bacnet_uri_dev_obj_id_edit.blockSignals(block)
 
-    def _handle_multiple_selection(self, entity_count, connection_count):
+    def _handle_multiple_selection(self, entities, connections, labels, rel_types):
         """Handle display and editing for multiple selected items."""
         # Button is already hidden (set in update_properties)
 
-        if entity_count > 0 and connection_count == 0:
-            self._handle_multiple_entities(entity_count)
-        elif entity_count == 0 and connection_count > 0:
-            self._handle_multiple_connections(connection_count)
+        if entities and not connections:
+            self._handle_multiple_entities(entities, labels)
+        elif connections and not entities:
+            self._handle_multiple_connections(connections, rel_types)
         else:
-            self._handle_mixed_selection(entity_count, connection_count)
+            self._handle_mixed_selection(len(entities), len(connections))
 
-    def _handle_multiple_entities(self, count):
+    def _handle_multiple_entities(self, entities, labels):
         """Handle when multiple entities are selected."""
         self._show_entity_form()  # Show the entity form container
-        self.type_uri_label.setText(f"{count} entities selected")
+        self.type_uri_label.setText(f"{len(entities)} entities selected")
         self.instance_uri_label.setText("Multiple instances")
         self.position_label.setText("Various positions")
         self.rotation_label.setText("Various rotations")
 
-        entities = [item for item in self.current_selection if isinstance(item, EntityItem)]
-        labels = set(entity.label for entity in entities)
-
         self.label_edit.setEnabled(True)  # Allow editing label even for multiple
         if len(labels) == 1:
             self.label_edit.blockSignals(True)
@@ -461,36 +615,23 @@ class PropertyPanel(QWidget):
             self.label_edit.blockSignals(False)
         # Button remains hidden
 
-    def _handle_multiple_connections(self, count):
+    def _handle_multiple_connections(self, connections, rel_types):
         """Handle when multiple connections are selected."""
         self._show_relationship_form()  # Show relationship form
-        self.rel_instance_uri_label.setText(f"{count} connections selected")
+        self.rel_instance_uri_label.setText(f"{len(connections)} connections selected")
         self.rel_type_uri_label.setText("Multiple connections")
         self.source_entity_label.setText("Various sources")
         self.target_entity_label.setText("Various targets")
 
-        connections = [item for item in self.current_selection if isinstance(item, ConnectionItem)]
-        rel_types = set(conn.relationship_type for conn in connections)
-
         if len(rel_types) == 1:
-            rel_type = next(iter(rel_types))
-            found = False
-            for i in range(self.rel_type_combo.count()):
-                if self.rel_type_combo.itemData(i) == rel_type:
-                    self.rel_type_combo.blockSignals(True)
-                    self.rel_type_combo.setCurrentIndex(i)
-                    self.rel_type_combo.blockSignals(False)
-                    found = True
-                    break
-            if not found:  # Handle case where saved type isn't in dropdown
-                self.rel_type_combo.blockSignals(True)
-                self.rel_type_combo.setCurrentIndex(-1)
-                self.rel_type_combo.blockSignals(False)
+            # -1 handles the case where the saved type isn't in the dropdown
+            index = self._rel_uri_to_index.get(next(iter(rel_types)), -1)
         else:
-            # Different types
-            self.rel_type_combo.blockSignals(True)
-            self.rel_type_combo.setCurrentIndex(-1)  # Indicate multiple types
-            self.rel_type_combo.blockSignals(False)
+            index = -1  # Indicate multiple types
+
+        self.rel_type_combo.blockSignals(True)
+        self.rel_type_combo.setCurrentIndex(index)
+        self.rel_type_combo.blockSignals(False)
         # Button remains hidden
 
     def _handle_mixed_selection(self, entity_count, connection_count):
@@ -534,25 +675,12 @@ class PropertyPanel(QWidget):
         self.rel_instance_uri_label.setText(str(connection_item.instance_uri))
         self.rel_type_uri_label.setText(str(connection_item.relationship_type))
 
-        source_uri = connection_item.get_source_entity_uri()
-        self.source_entity_label.setText(str(source_uri) if source_uri else "Unknown source")
-
-        target_uri = connection_item.get_target_entity_uri()
-        self.target_entity_label.setText(str(target_uri) if target_uri else "Unknown target")
+        self._refresh_endpoint_labels(connection_item)
 
-        # Set relationship type in combo box
-        found = False
-        for i in range(self.rel_type_combo.count()):
-            if self.rel_type_combo.itemData(i) == connection_item.relationship_type:
-                self.rel_type_combo.blockSignals(True)
-                self.rel_type_combo.setCurrentIndex(i)
-                self.rel_type_combo.blockSignals(False)
-                found = True
-                break
-        if not found:  # Clear combo if type not found
-            self.rel_type_combo.blockSignals(True)
-            self.rel_type_combo.setCurrentIndex(-1)
-            self.rel_type_combo.blockSignals(False)
+        # Set relationship type in combo box (cleared if type not found)
+        self.rel_type_combo.blockSignals(True)
+        self.rel_type_combo.setCurrentIndex(self._rel_uri_to_index.get(connection_item.relationship_type, -1))
+        self.rel_type_combo.blockSignals(False)
 
         # Set color button background
         current_color = connection_item.pen().color()
@@ -560,61 +688,65 @@ class PropertyPanel(QWidget):
 
         # Button visibility is handled in update_properties
 
+    def _refresh_endpoint_labels(self, connection_item):
+        """Update the source and target labels of a single connection."""
+        source_uri = connection_item.get_source_entity_uri()
+        self.source_entity_label.setText(str(source_uri) if source_uri else "Unknown source")
+
+        target_uri = connection_item.get_target_entity_uri()
+        self.target_entity_label.setText(str(target_uri) if target_uri else "Unknown target")
+
     def _update_relationship_type(self, index):
         """Update the relationship type for all selected connections."""
-        if index < 0 or not self.current_selection:  # Check index and selection
+        if index < 0 or not self._current_connections:  # Check index and selection
             return
 
-        rel_type = self.rel_type_combo.itemData(index)
-        if not rel_type:  # Ensure data is valid
-            return
+        rel_type = self._combo_uris[index]
 
-        for item in self.current_selection:
-            if isinstance(item, ConnectionItem):
-                item.set_relationship_type(rel_type)
+        for item in self._current_connections:
+            item.set_relationship_type(rel_type)
+        self.relationship_type_changed.emit(self._current_connections)
         # Update the display for the current item if it's a connection
-        if isinstance(self.current_item, ConnectionItem):
+        if type(self.current_item) is ConnectionItem:
             self.rel_type_uri_label.setText(str(rel_type))
 
     def _choose_connection_color(self):
         """Open color dialog to choose connection color for all selected connections."""
-        connections = [item for item in self.current_selection if isinstance(item, ConnectionItem)]
+        connections = self._current_connections
         if not connections:
             return
 
-        current_color = connections[0].pen().color()
-        color = QColorDialog.getColor(current_color, self, "Choose Connection Color")
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Choose Connection Color")
+
+        self._color_dialog.setCurrentColor(connections[0].pen().color())
+        if self._color_dialog.exec_() != QColorDialog.Accepted:
+            return
 
+        color = self._color_dialog.selectedColor()
         if color.isValid():
             for item in connections:
-                item_pen = item.pen()
-                new_pen = QPen(item_pen)
-                new_pen.setColor(color)
-                item.setPen(new_pen)
-                # Update arrows immediately
-                for arrow in item.arrows:
-                    arrow.setPen(new_pen)
-                    arrow.setBrush(QBrush(color))
+                pen = item.pen()  # Already a copy, keeps style and width
+                pen.setColor(color)
+                item.setPen(pen)
 
             self.color_button.setStyleSheet(f"background-color: {color.name()}")
 
     def _reverse_connection_direction(self):
         """Reverse the direction of all selected connections."""
-        connections_reversed = False
-        for item in self.current_selection:
-            if isinstance(item, ConnectionItem):
-                item.reverse()
-                connections_reversed = True
+        for item in self._current_connections:
+            item.reverse()
 
-        # Update properties only if something was actually reversed
-        if connections_reversed:
-            self.update_properties(self.current_selection)
+        # Only the endpoints changed; multi-selections show "Various" anyway
+        if self._current_connections and len(self.current_selection) == 1:
+            self._refresh_endpoint_labels(self.current_item)
 
     def _open_external_references_dialog(self):
         """Open the dialog to manage external references for the selected Point."""
         # Check should be reliable now due to button visibility logic
-        if len(self.current_selection) == 1 and isinstance(self.current_item, EntityItem) and isinstance(
-                self.current_item.entity, Point):
+        if len(self.current_selection) == 1 and type(self.current_item) is EntityItem and \
+                self.current_item.is_point:
             point_item = self.current_item
             dialog = ExternalReferencesDialog(point_item, self)
             dialog.exec_()  # Show modally
@@ -630,6 +762,8 @@ class EntityBrowser(QTreeWidget):
         super().__init__(parent)
         self.setHeaderLabel("Entities")
         self.setDragEnabled(True)
+        # Encoded SVG and URI mime data per entity URI, filled on first drag
+        self._drag_data = {}
         self._populate_entity_tree()
 
         # Expand all items in the tree
@@ -639,48 +773,52 @@ class EntityBrowser(QTreeWidget):
         """Load entities into the tree view organized by category."""
         entities = EntityLibrary.get_all_entities()
 
-        # Track category paths with their tree items
+        # Track category paths (tuples of category names) with their tree items
         category_items = {}
 
+        # Tree items along the previous entity's category path; library
+        # entities come grouped, so most of the path is usually shared
+        previous_categories = ()
+        path_items = []
+
         for entity in entities:
-            current_path = ""
-            parent_item = None
-
-            # Process each category in the hierarchy
-            for category in entity.category:
-                # Build path
-                if current_path:
-                    current_path += "/" + category
-                else:
-                    current_path = category
+            categories = tuple(entity.category)
+
+            # Keep the tree items of the prefix shared with the previous entity
+            shared = 0
+            for previous, current in zip(previous_categories, categories):
+                if previous != current:
+                    break
+                shared += 1
+            del path_items[shared:]
+            previous_categories = categories
+
+            # Process the remaining categories in the hierarchy
+            for depth in range(shared + 1, len(categories) + 1):
+                current_path = categories[:depth]
+                category_tree_item = category_items.get(current_path)
 
                 # Create category if it doesn't exist
-                if current_path not in category_items:
-                    category_tree_item = QTreeWidgetItem([category])
+                if category_tree_item is None:
+                    category_tree_item = QTreeWidgetItem([categories[depth - 1]])
 
-                    if parent_item:
-                        parent_item.addChild(category_tree_item)
+                    if path_items:
+                        path_items[-1].addChild(category_tree_item)
                     else:
                         self.addTopLevelItem(category_tree_item)
 
                     category_items[current_path] = category_tree_item
 
-                # Update parent for next iteration
-                parent_item = category_items[current_path]
+                path_items.append(category_tree_item)
+
+            parent_item = path_items[-1] if path_items else None
 
             # Add entity as leaf node
             entity_item = QTreeWidgetItem([entity.name])
             entity_item.setData(0, Qt.UserRole, entity)
 
             # Create icon from SVG
-            renderer = QSvgRenderer(QByteArray(entity.svg_data.encode()))
-            pixmap = QPixmap(24, 24)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            entity_item.setIcon(0, QIcon(pixmap))
+            entity_item.setIcon(0, _render_entity_icon(entity))
 
             # Add to tree
             parent_item.addChild(entity_item)
@@ -707,12 +845,18 @@ class EntityBrowser(QTreeWidget):
         # Store entity data
         mime_data.setText(entity.name)
 
+        drag_data = self._drag_data.get(entity.uri_ref)
+        if drag_data is None:
+            drag_data = self._drag_data[entity.uri_ref] = (
+                QByteArray(entity.svg_data.encode()),
+                QByteArray(str(entity.uri_ref).encode()),
+            )
+        svg_bytes, uri_bytes = drag_data
+
         # Store SVG data
-        svg_bytes = QByteArray(entity.svg_data.encode())
         mime_data.setData("application/entity-svg", svg_bytes)
 
         # Store URI
-        uri_bytes = QByteArray(str(entity.uri_ref).encode())
         mime_data.setData("application/entity-uri", uri_bytes)
 
         drag.setMimeData(mime_data)
@@ -721,6 +865,17 @@ class EntityBrowser(QTreeWidget):
         drag.exec_(Qt.CopyAction)
 
 
+# View transforms for each zoom level, one level scales by ZOOM_STEP
+ZOOM_STEP = 1.1
+MAX_ZOOM_LEVEL = 30
+# The toolbar zooms by 1.2 per click, which is a fractional number of levels
+TOOLBAR_ZOOM_LEVELS = math.log(1.2) / math.log(ZOOM_STEP)
+_ZOOM_TRANSFORMS = {
+    level: QTransform.fromScale(ZOOM_STEP ** level, ZOOM_STEP ** level)
+    for level in range(-MAX_ZOOM_LEVEL, MAX_ZOOM_LEVEL + 1)
+}
+
+
 class Canvas(QGraphicsView):
     """Interactive canvas for building system designs."""
 
@@ -736,7 +891,9 @@ class Canvas(QGraphicsView):
         # View settings
         self.setRenderHint(QPainter.Antialiasing)
         self.setDragMode(QGraphicsView.RubberBandDrag)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # All items set their own pen and brush
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.setAcceptDrops(True)
@@ -751,6 +908,15 @@ class Canvas(QGraphicsView):
         self.connection_in_progress = False
         self.temp_connection: ConnectionItem = None
         self.source_port = None
+        # Candidate target ports bucketed by grid cell, only while a connection is drawn
+        self._port_index = None
+
+        # Coalesce temp connection updates to ~60 Hz while dragging
+        self._pending_end_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_temp_connection)
 
         # Panning attributes
         self.is_panning = False
@@ -761,16 +927,67 @@ class Canvas(QGraphicsView):
         # Add state tracking for points visibility
         self.points_visible = True
 
+        # Current zoom level, see _ZOOM_TRANSFORMS
+        self._zoom_level = 0
+
         # Clipboard
         self.copied_items = []
 
+        # Entities and connections on the canvas, kept up to date by _add_item/_remove_item
+        self._entity_items = set()
+        self._connection_items = set()
+        # Subsets toggled by toggle_points_visibility
+        self._point_entity_items = set()
+        self._point_connection_items = set()
+        properties_panel.relationship_type_changed.connect(self._update_point_connections)
+
+        # Refresh the property panel once the selection settles, e.g. after a rubber band drag
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._flush_selection_changed)
+
+        # Write status messages at most every 50 ms, e.g. while wheel zooming
+        self._pending_message = None
+        self._message_timer = QTimer(self)
+        self._message_timer.setSingleShot(True)
+        self._message_timer.setInterval(50)
+        self._message_timer.timeout.connect(self._flush_message)
+
+        # Key shortcuts: Ctrl combinations need exactly Ctrl, the others fire with any modifiers
+        self._ctrl_key_handlers = {
+            Qt.Key_A: self._select_all_shortcut,
+            Qt.Key_C: self._copy_shortcut,
+            Qt.Key_V: self._paste_shortcut,
+        }
+        self._key_handlers = {
+            Qt.Key_H: self.showShortcutTips,
+            Qt.Key_Delete: self._delete_selected_items,
+            Qt.Key_R: self._rotate_selected_entities,
+            Qt.Key_P: self.toggle_points_visibility,
+            Qt.Key_Plus: self._zoom_in_shortcut,
+            Qt.Key_Equal: self._zoom_in_shortcut,  # Equal key often shares with Plus
+            Qt.Key_Minus: self._zoom_out_shortcut,
+        }
+
         # Connect signals
         self.scene.selectionChanged.connect(self._handle_selection_changed)
 
         self.logger: Logger = Logger(self)
 
     def show_message(self, text: str):
-        self.parent().statusBar().showMessage(text)
+        """Queue a status bar message; only the latest one of a burst is shown."""
+        self._pending_message = text
+        if not self._message_timer.isActive():
+            self._message_timer.start()
+
+    def _flush_message(self):
+        """Show the queued status bar message."""
+        if self._pending_message is None:
+            return
+
+        self.parent().statusBar().showMessage(self._pending_message)
+        self._pending_message = None
 
     def update_property_panel(self, items=None):
         """Update the property panel with selected item information."""
@@ -779,14 +996,96 @@ class Canvas(QGraphicsView):
             self.property_panel.update_properties(items)
 
     def _handle_selection_changed(self):
-        """Handle scene selection changes and update property panel once."""
+        """Handle scene selection changes by (re)starting the panel refresh timer."""
+        self._selection_timer.start()
+
+    def _flush_selection_changed(self):
+        """Update the property panel with the settled selection."""
 
         selected = self.scene.selectedItems()
 
         self.update_property_panel(selected)
 
+    @contextlib.contextmanager
+    def _bulk_add(self, reindex: bool = False):
+        """Disable repaints, and with reindex also scene indexing, while many items are added at once."""
+        index_method = self.scene.itemIndexMethod()
+        update_mode = self.viewportUpdateMode()
+        if reindex:
+            self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+        try:
+            yield
+        finally:
+            if reindex:
+                # Rebuilds the BSP tree for the whole scene, so only full imports use it
+                self.scene.setItemIndexMethod(index_method)
+            self.setViewportUpdateMode(update_mode)
+            self.viewport().update()
+
+    @contextlib.contextmanager
+    def _batched_selection(self):
+        """Emit a single selectionChanged for many selection changes."""
+        was_blocked = self.scene.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.scene.blockSignals(was_blocked)
+            if not was_blocked:
+                self.scene.selectionChanged.emit()
+
+    def _register_item(self, item):
+        """Track an entity or connection that is in the scene."""
+        item_type = type(item)
+        if item_type is EntityItem:
+            self._entity_items.add(item)
+            if item.is_point:
+                self._point_entity_items.add(item)
+        elif item_type is ConnectionItem:
+            self._connection_items.add(item)
+            if item.relationship_type in POINT_RELATIONSHIPS:
+                self._point_connection_items.add(item)
+
+    def _update_point_connections(self, connections):
+        """Re-sort connections whose relationship type has changed."""
+        for item in connections:
+            if item not in self._connection_items:
+                continue
+            if item.relationship_type in POINT_RELATIONSHIPS:
+                self._point_connection_items.add(item)
+            else:
+                self._point_connection_items.discard(item)
+
+    def _add_item(self, item):
+        """Add an item to the scene and register it by type."""
+        self.scene.addItem(item)
+        self._register_item(item)
+
+    def _remove_item(self, item):
+        """Remove an item from the scene and from its type registry."""
+        item_type = type(item)
+        if item_type is ConnectionItem:
+            self._connection_items.discard(item)
+            self._point_connection_items.discard(item)
+            item.remove()  # Also unregisters it from its ports
+            return
+
+        if item_type is EntityItem:
+            self._entity_items.discard(item)
+            self._point_entity_items.discard(item)
+        self.scene.removeItem(item)
+
+    def iter_uri_items(self):
+        """Iterate over the entities and connections on the canvas, the items that carry an instance URI."""
+        return itertools.chain(self._entity_items, self._connection_items)
+
     def _draw_grid(self):
         """Draw background grid lines."""
+        with self._bulk_add():
+            self._add_grid_items()
+
+    def _add_grid_items(self):
+        """Add the grid, point line and frame items to the scene."""
 
         grid_pen = QPen(QColor(230, 230, 230))
         grid_pen.setStyle(Qt.DotLine)
@@ -794,13 +1093,23 @@ class Canvas(QGraphicsView):
         # Use class variables for dimensions
         width, height = AppConfig.canvas_width, AppConfig.canvas_height
 
+        # All grid lines share one path, so the grid is a single scene item
+        grid_path = QPainterPath()
+
         # Horizontal grid lines
         for y in range(0, height, AppConfig.grid_size):
-            self.scene.addLine(0, y, width, y, grid_pen)
+            grid_path.moveTo(0, y)
+            grid_path.lineTo(width, y)
 
         # Vertical grid lines
         for x in range(0, width, AppConfig.grid_size):
-            self.scene.addLine(x, 0, x, height, grid_pen)
+            grid_path.moveTo(x, 0)
+            grid_path.lineTo(x, height)
+
+        grid_item = self.scene.addPath(grid_path, grid_pen)
+        grid_item.setZValue(-1)
+        # Rasterize the dotted lines once instead of stroking them on every repaint
+        grid_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # Add special line for Points
         point_line_pen = QPen(QColor(215, 215, 215), 2)
@@ -814,10 +1123,6 @@ class Canvas(QGraphicsView):
         # Set scene size
         self.scene.setSceneRect(0, 0, width, height)
 
-        # Draw black frame around the grid
-        frame_pen = QPen(AppConfig.frame_color, AppConfig.frame_width)
-        self.scene.addRect(0, 0, AppConfig.canvas_width, AppConfig.canvas_height, frame_pen)
-
     def dragEnterEvent(self, event):
         """Handle drag enter events for entity creation."""
         if event.mimeData().hasFormat("application/entity-svg"):
@@ -842,32 +1147,34 @@ class Canvas(QGraphicsView):
                 pos = self.mapToScene(event.pos())
 
                 # Get SVG dimensions for centering
-                svg_width = entity_item.renderer.defaultSize().width()
-                svg_height = entity_item.renderer.defaultSize().height()
+                default_size = entity_item.renderer.defaultSize()
+                svg_width = default_size.width()
+                svg_height = default_size.height()
 
                 # Calculate center offset
                 center_x = svg_width / 2
                 center_y = svg_height / 2
 
                 # Check if this is a Point entity
-                is_point = isinstance(entity_item.entity, Point)
+                is_point = entity_item.is_point
 
                 # Snap X coordinate to grid
                 # Subtract center_x to center entity on drop point
-                x = round(pos.x() / AppConfig.grid_size) * AppConfig.grid_size - center_x
+                grid_size = AppConfig.grid_size
+                x = round(pos.x() / grid_size) * grid_size - center_x
 
                 # Set Y coordinate - enforce constraint for Points
                 if is_point:
                     y = AppConfig.get_point_line_height() - center_y
                 else:
                     # Subtract center_y to center entity on drop point
-                    y = round(pos.y() / AppConfig.grid_size) * AppConfig.grid_size - center_y
+                    y = round(pos.y() / grid_size) * grid_size - center_y
 
                 # Set position
                 entity_item.setPos(x, y)
 
                 # Now add to scene
-                self.scene.addItem(entity_item)
+                self._add_item(entity_item)
 
                 # Select the new entity
                 self.scene.clearSelection()
@@ -887,9 +1194,12 @@ class Canvas(QGraphicsView):
 
         self.connection_in_progress = True
         self.source_port = port_item
+        self._build_port_index()
 
         # Create temporary connection
         self.temp_connection = ConnectionItem(self.source_port)
+        # Its geometry changes on every move tick, so a cached pixmap would be thrown away each frame
+        self.temp_connection.setCacheMode(QGraphicsItem.NoCache)
         self.scene.addItem(self.temp_connection)
 
         # Set initial end position
@@ -901,11 +1211,11 @@ class Canvas(QGraphicsView):
     def _finish_connection_creation(self, event):
         """Finalize connection creation on mouse release."""
         target_port = None
-        # Get item under cursor
-        item = self.itemAt(event.pos())
+        # The port highlighted while hovering is the target, so highlight and drop agree
+        item = self.hovered_port
 
         # Check if target is a valid port
-        if isinstance(item, PortItem) and item != self.source_port:
+        if item is not None and item is not self.source_port:
             target_port = item
 
         if self.hovered_port:
@@ -919,15 +1229,13 @@ class Canvas(QGraphicsView):
             self.temp_connection.set_target_port(target_port)  # Use the stored target_port
 
             # Example:
-            source_entity = self.source_port.entity_item
-            target_entity = target_port.entity_item
-            source_is_point = isinstance(source_entity.entity, Point)
-            target_is_point = isinstance(target_entity.entity, Point)
+            if target_port.entity_item.is_point:
+                self.temp_connection.relationship_type = HAS_POINT
+            if self.source_port.entity_item.is_point:
+                self.temp_connection.relationship_type = IS_POINT_OF
 
-            if target_is_point:
-                self.temp_connection.relationship_type = BRICK_RELATIONSHIPS["hasPoint"]
-            if source_is_point:
-                self.temp_connection.relationship_type = BRICK_RELATIONSHIPS["isPointOf"]
+            self.temp_connection.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._register_item(self.temp_connection)
 
             self.show_message("Connection created")  # Or more specific message
             self.scene.clearSelection()
@@ -940,22 +1248,31 @@ class Canvas(QGraphicsView):
             self.show_message("Connection canceled")
 
         # Reset state
+        self._move_timer.stop()
+        self._pending_end_pos = None
         self.connection_in_progress = False
         self.temp_connection = None
         self.source_port = None
+        self._port_index = None
 
         event.accept()
 
+    def _flush_temp_connection(self):
+        """Apply the latest pending end position to the temporary connection."""
+
+        if self.temp_connection and self._pending_end_pos is not None:
+            self.temp_connection.set_current_end_pos(self._pending_end_pos)
+        self._pending_end_pos = None
+
     def mousePressEvent(self, event):
         """Handle mouse press events for connection creation and selection."""
 
-        # Get item under cursor
-        item = self.itemAt(event.pos())
-
-        # Check if starting a connection from a port
-        if isinstance(item, PortItem) and event.button() == Qt.LeftButton:
-            self._start_connection_creation(item, event)
-            return
+        # Check if starting a connection from a port (only left clicks need the item under cursor)
+        if event.button() == Qt.LeftButton:
+            item = self.itemAt(event.pos())
+            if type(item) is PortItem:
+                self._start_connection_creation(item, event)
+                return
 
         # Pan on middle mouse button
         if event.button() == Qt.MiddleButton:
@@ -975,9 +1292,13 @@ class Canvas(QGraphicsView):
         current_hover_target = None
 
         if self.connection_in_progress and self.temp_connection:
-            item_under_cursor = self.itemAt(event.pos())
-            if isinstance(item_under_cursor, PortItem) and item_under_cursor != self.source_port:
-                current_hover_target = item_under_cursor
+            scene_pos = self.mapToScene(event.pos())
+
+            if previously_hovered and self._port_contains(previously_hovered, scene_pos):
+                # Still over the highlighted port, no need to pick again
+                current_hover_target = previously_hovered
+            else:
+                current_hover_target = self._port_at(scene_pos)
 
             if previously_hovered != current_hover_target:
                 # Reset the previously hovered port (if any)
@@ -992,10 +1313,11 @@ class Canvas(QGraphicsView):
 
                 self.hovered_port = current_hover_target
 
-        # Update temporary connection during creation
+        # Update temporary connection during creation (applied by the move timer)
         if self.connection_in_progress and self.temp_connection:
-            mouse_scene_pos = self.mapToScene(event.pos())
-            self.temp_connection.set_current_end_pos(mouse_scene_pos)
+            self._pending_end_pos = scene_pos
+            if not self._move_timer.isActive():
+                self._move_timer.start()
 
         # Handle panning movement (keep this logic)
         if self.is_panning and self.last_pan_point:
@@ -1020,6 +1342,44 @@ class Canvas(QGraphicsView):
         # For other moves (like item dragging), use default behavior
         super().mouseMoveEvent(event)
 
+    def _build_port_index(self):
+        """Bucket the ports of all visible entities, except the source port, by grid cell."""
+        cell_size = AppConfig.grid_size
+        port_index = {}
+        for entity_item in self._entity_items:
+            port = entity_item.port
+            if port is self.source_port or not entity_item.isVisible():
+                continue
+            pos = port.scenePos()
+            port_index.setdefault((pos.x() // cell_size, pos.y() // cell_size), []).append(port)
+        self._port_index = port_index
+
+    def _port_at(self, scene_pos):
+        """Find the indexed port whose (unhovered) circle contains a scene position."""
+        cell_size = AppConfig.grid_size
+        cell_x = scene_pos.x() // cell_size
+        cell_y = scene_pos.y() // cell_size
+        radius_sq = PortItem.NORMAL_RADIUS * PortItem.NORMAL_RADIUS
+
+        # Port circles are much smaller than a cell, so the neighbouring cells suffice
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for port in self._port_index.get((cell_x + dx, cell_y + dy), ()):
+                    center = port.scenePos()
+                    offset_x = scene_pos.x() - center.x()
+                    offset_y = scene_pos.y() - center.y()
+                    if offset_x * offset_x + offset_y * offset_y <= radius_sq:
+                        return port
+        return None
+
+    @staticmethod
+    def _port_contains(port, scene_pos):
+        """Check whether a scene position lies on a (hovered) port circle."""
+        center = port.scenePos()
+        dx = scene_pos.x() - center.x()
+        dy = scene_pos.y() - center.y()
+        return dx * dx + dy * dy <= PortItem.HOVER_RADIUS * PortItem.HOVER_RADIUS
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release events for connection creation and selection."""
         # Finalize connection creation
@@ -1044,7 +1404,7 @@ class Canvas(QGraphicsView):
         item = self.itemAt(event.pos())
 
         # Check if clicked on a connection
-        if isinstance(item, ConnectionItem):
+        if type(item) is ConnectionItem:
             # Get position in scene coordinates
             scene_pos = self.mapToScene(event.pos())
 
@@ -1069,20 +1429,17 @@ class Canvas(QGraphicsView):
 
         # Check if Ctrl key is pressed for zooming
         if event.modifiers() == Qt.ControlModifier:
-            # Calculate zoom factor
-            factor = 1.1
-
             # Normalize the delta value for wheel scrolling
             delta = event.angleDelta().y() / 8  # Normalize to standard units (usually 120 for one step)
 
             if delta < 0:
                 # Zoom out
-                self.scale(1.0 / factor, 1.0 / factor)
+                self.zoom_by(-1)
                 self.show_message("Zoom Out")
 
             else:
                 # Zoom in
-                self.scale(factor, factor)
+                self.zoom_by(1)
                 self.show_message("Zoom In")
 
             event.accept()
@@ -1094,85 +1451,68 @@ class Canvas(QGraphicsView):
     def keyPressEvent(self, event):
         """Handle key press events for various operations."""
 
-        # Select all items
-        if event.key() == Qt.Key_A and event.modifiers() == Qt.ControlModifier:
-            self.select_all()
-            self.show_message("Selected All Items")
-            event.accept()
-            return
-
-        # Show shortcuts
-        if event.key() == Qt.Key_H:
-            self.showShortcutTips()
-            event.accept()
-            return
-
-        # Delete selected items
-        if event.key() == Qt.Key_Delete:
-            items_count = len(self.scene.selectedItems())
-            if items_count > 0:
-                self._delete_selected_items()
-            event.accept()
-            return
-
-        # Rotate selected entities
-        if event.key() == Qt.Key_R:
-            selected_entities = [item for item in self.scene.selectedItems()
-                                 if isinstance(item, EntityItem)]
-            if selected_entities:
-                self._rotate_selected_entities()
-            event.accept()
-            return
-
-        # Copy selected items
-        if event.key() == Qt.Key_C and event.modifiers() == Qt.ControlModifier:
-            selected_count = len(self.scene.selectedItems())
-            if selected_count > 0:
-                self._copy_selected_items()
-
-            event.accept()
-            return
-
-        # Paste copied items
-        if event.key() == Qt.Key_V and event.modifiers() == Qt.ControlModifier:
-            if self.copied_items:
-                self._paste_copied_items()
-                entity_count = len(self.copied_items.get('entities', {}))
-            event.accept()
-            return
+        handler = None
+        if event.modifiers() == Qt.ControlModifier:
+            handler = self._ctrl_key_handlers.get(event.key())
+        if handler is None:
+            handler = self._key_handlers.get(event.key())
 
-        # Toggle Points visibility with P key
-        if event.key() == Qt.Key_P:
-            self.toggle_points_visibility()
-            status = "Show" if self.points_visible else "Hide"
+        if handler is not None:
+            handler()
             event.accept()
             return
 
-        # Zoom in with + key
-        if event.key() == Qt.Key_Plus or event.key() == Qt.Key_Equal:  # Equal key often shares with Plus
-            self.scale(1.1, 1.1)
+        # For other keys, use default behavior
+        super().keyPressEvent(event)
 
-            if hasattr(self, 'parent') and callable(self.parent) and self.parent():
-                self.show_message("Zoomed in")
-            event.accept()
+    def _select_all_shortcut(self):
+        self.select_all()
+        self.show_message("Selected All Items")
+
+    def _copy_shortcut(self):
+        if self.scene.selectedItems():
+            self._copy_selected_items()
+
+    def _paste_shortcut(self):
+        if self.copied_items:
+            self._paste_copied_items()
+
+    def _zoom_in_shortcut(self):
+        self.zoom_by(1)
+        if self.parent():
+            self.show_message("Zoomed in")
+
+    def _zoom_out_shortcut(self):
+        self.zoom_by(-1)
+        if self.parent():
+            self.show_message("Zoomed out")
+
+    def zoom_by(self, steps: float):
+        """Zoom in (positive) or out (negative) by a number of zoom levels."""
+        level = max(-MAX_ZOOM_LEVEL, min(MAX_ZOOM_LEVEL, self._zoom_level + steps))
+        if abs(level - round(level)) < 1e-9:
+            # Toolbar steps cancel out, so snap back onto the table
+            level = round(level)
+        if level == self._zoom_level:
             return
 
-        # Zoom out with - key
-        if event.key() == Qt.Key_Minus:
-            self.scale(1 / 1.1, 1 / 1.1)
-
-            if hasattr(self, 'parent') and callable(self.parent) and self.parent():
-                self.show_message("Zoomed out")
-            event.accept()
-            return
+        self._zoom_level = level
+        transform = _ZOOM_TRANSFORMS.get(level)
+        if transform is None:
+            # Off the table after toolbar zooming
+            scale = ZOOM_STEP ** level
+            transform = QTransform.fromScale(scale, scale)
+        self.setTransform(transform)
 
-        # For other keys, use default behavior
-        super().keyPressEvent(event)
+    def reset_zoom(self):
+        """Reset the view to 100% zoom."""
+        self._zoom_level = 0
+        self.resetTransform()
 
     def _rotate_selected_entities(self):
         """Rotate all selected entity items by 90 degrees."""
         selected_entities = [item for item in self.scene.selectedItems()
-                             if isinstance(item, EntityItem)]
+                             if type(item) is EntityItem]
 
         if not selected_entities:
             return
@@ -1194,37 +1534,40 @@ class Canvas(QGraphicsView):
 
         # Create copy of the list since we'll be modifying it
         items_to_delete = selected_items.copy()
-
-        for item in items_to_delete:
-            if isinstance(item, ConnectionItem):
-                # Handle connection removal
-                item.remove()
-            elif isinstance(item, EntityItem):
-                # Remove all connected connections first
-                connections = []
-                if hasattr(item, 'port'):
-                    connections = item.port.connections.copy()
-
-                # Remove connections
-                for connection in connections:
-                    connection.remove()
-
-                # Remove entity
-                self.scene.removeItem(item)
-            elif isinstance(item, JointItem):
-                # Remove joint from connection
-                if item.connection:
-                    if item in item.connection.joints:
-                        item.connection.joints.remove(item)
-
-                    # Update connection
-                    item.connection.update_position()
-
-                    # Remove joint
+        joints_by_connection = {}
+
+        with self._batched_selection():
+            for item in items_to_delete:
+                item_type = type(item)
+                if item_type is ConnectionItem:
+                    # Handle connection removal
+                    self._remove_item(item)
+                elif item_type is EntityItem:
+                    # Remove all connected connections first
+                    connections = []
+                    if hasattr(item, 'port'):
+                        connections = item.port.connections.copy()
+
+                    # Remove connections
+                    for connection in connections:
+                        self._remove_item(connection)
+
+                    # Remove entity
+                    self._remove_item(item)
+                elif item_type is JointItem:
+                    # Collect joints per connection and remove them in one go below
+                    if item.connection:
+                        joints_by_connection.setdefault(item.connection, []).append(item)
+                else:
+                    # Remove other items
                     self.scene.removeItem(item)
-            else:
-                # Remove other items
-                self.scene.removeItem(item)
+
+            for connection, joints in joints_by_connection.items():
+                # Joints of connections deleted above have already left with them
+                if connection not in self._connection_items:
+                    continue
+                connection.remove_joints(joints)
+                connection.update_position()
 
         # Property panel will update automatically due to selection change
         self.show_message(f"Deleted {len(items_to_delete)} item(s)")
@@ -1237,18 +1580,18 @@ class Canvas(QGraphicsView):
         # Clear clipboard
         self.copied_items = []
         copied_entities = {}
+        source_items = {}
 
-        # First pass: copy selected entities
+        # First pass: copy selected entities as (type URI, (x, y), rotation, is_point)
+        entity_items = self._entity_items
         for item in selected_items:
-            if isinstance(item, EntityItem):
-                # Store entity details
+            if item in entity_items:
                 original_id = id(item)
-                copied_entities[original_id] = {
-                    'entity': item.entity,
-                    'pos': item.pos(),
-                    'rotation': item.rotation_angle,
-                    'original_item': item
-                }
+                pos = item.pos()
+                copied_entities[original_id] = (
+                    item.entity.uri_ref, (pos.x(), pos.y()), item.rotation_angle, item.is_point
+                )
+                source_items[original_id] = item
 
         # Check if anything to copy
         if not copied_entities:
@@ -1258,29 +1601,33 @@ class Canvas(QGraphicsView):
         # Second pass: find connections between selected entities
         copied_connections = []
 
-        for item in self.scene.items():
-            if isinstance(item, ConnectionItem):
-                # Get endpoints
-                source_entity_item = item.source_port.entity_item if item.source_port else None
-                target_entity_item = item.target_port.entity_item if item.target_port else None
+        # Only connections attached to a copied entity's port can qualify
+        for source_id, source_item in source_items.items():
+            source_port = source_item.port
+
+            for item in source_port.connections:
+                # Visit each connection once, from its source entity
+                if item.source_port is not source_port:
+                    continue
 
                 # Skip incomplete connections
-                if not source_entity_item or not target_entity_item:
+                target_entity_item = item.target_port.entity_item if item.target_port else None
+                if not target_entity_item:
                     continue
 
-                # Check if both endpoints are in copied entities
-                source_id = id(source_entity_item)
+                # Check if the target is copied as well
                 target_id = id(target_entity_item)
 
-                if source_id in copied_entities and target_id in copied_entities:
+                if target_id in copied_entities:
                     # Copy connection details
+                    pen = item.pen()
                     copied_connections.append({
                         'source_id': source_id,
                         'target_id': target_id,
                         'relationship_type': item.relationship_type,
-                        'color': item.pen().color(),
-                        'style': item.pen().style(),
-                        'width': item.pen().width(),
+                        'color': pen.color(),
+                        'style': pen.style(),
+                        'width': pen.width(),
                         'joints': [joint.scenePos() for joint in item.joints]
                     })
 
@@ -1313,99 +1660,92 @@ class Canvas(QGraphicsView):
             self.show_message("No entities to paste")
             return
 
-        # Clear current selection
-        self.scene.clearSelection()
-
-        # Apply offset for paste position
-        offset_x = 50
-        offset_y = 50
-
-        # First create new entities
-        new_entity_mapping = {}
+        with self._bulk_add(), self._batched_selection():
+            # Clear current selection
+            self.scene.clearSelection()
 
-        for original_id, item_data in copied_entities.items():
-            # Create new entity with same type
-            original_entity = item_data['entity']
-            new_item = EntityItem(original_entity.uri_ref)
+            # Apply offset for paste position
+            offset_x = 50
+            offset_y = 50
+            offset = QPointF(offset_x, offset_y)
+            point_line_height = AppConfig.get_point_line_height()
 
-            # Check if point - enforce constraint
-            is_point = isinstance(original_entity, Point)
+            # First create new entities
+            new_entity_mapping = {}
 
-            # Position with offset
-            original_pos = item_data['pos']
-            pos_x = original_pos.x() + offset_x
-            if is_point:
-                # Points always go on the line
-                pos_y = AppConfig.get_point_line_height() - new_item.renderer.defaultSize().height() / 2
+            for original_id, (uri_ref, (x, y), rotation, is_point) in copied_entities.items():
+                # Create new entity with same type
+                new_item = EntityItem(uri_ref)
 
-            else:
-                # Other entities use regular offset
-                pos_y = original_pos.y() + offset_y
+                # Position with offset
+                pos_x = x + offset_x
+                if is_point:
+                    # Points always go on the line
+                    pos_y = point_line_height - new_item.renderer.defaultSize().height() / 2
 
-            print(original_pos, (pos_x, pos_y))
+                else:
+                    # Other entities use regular offset
+                    pos_y = y + offset_y
 
-            new_item.setPos(pos_x, pos_y)
+                new_item.setPos(pos_x, pos_y)
 
-            # Apply rotation if needed
-            # In _paste_copied_items:
-            if 'rotation' in item_data:
-                rotation = item_data['rotation']
-                new_item.apply_rotation(rotation)
+                # Apply rotation if needed
+                if rotation:
+                    new_item.apply_rotation(rotation)
 
-            # Add to scene
-            self.scene.addItem(new_item)
+                # Add to scene
+                self._add_item(new_item)
 
-            # Select item
-            new_item.setSelected(True)
+                # Select item
+                new_item.setSelected(True)
 
-            # Store in mapping
-            new_entity_mapping[original_id] = new_item
+                # Store in mapping
+                new_entity_mapping[original_id] = new_item
 
-        # Then create connections between new entities
-        new_connections = []
-        new_joints = []
+            # Then create connections between new entities
+            new_connections = []
+            new_joints = []
 
-        for conn_data in copied_connections:
-            # Get source and target from mapping
-            source_id = conn_data['source_id']
-            target_id = conn_data['target_id']
+            for conn_data in copied_connections:
+                # Get source and target from mapping
+                source_id = conn_data['source_id']
+                target_id = conn_data['target_id']
 
-            if source_id not in new_entity_mapping or target_id not in new_entity_mapping:
-                continue
+                if source_id not in new_entity_mapping or target_id not in new_entity_mapping:
+                    continue
 
-            # Get new entities
-            source_item = new_entity_mapping[source_id]
-            target_item = new_entity_mapping[target_id]
+                # Get new entities
+                source_item = new_entity_mapping[source_id]
+                target_item = new_entity_mapping[target_id]
 
-            # Create new connection
-            connection = ConnectionItem(source_item.port, target_item.port)
-            connection.set_relationship_type(conn_data['relationship_type'])
+                # Create new connection
+                connection = ConnectionItem(source_item.port, target_item.port)
+                connection.set_relationship_type(conn_data['relationship_type'])
 
-            # Set style
-            pen = QPen(conn_data['color'], conn_data['width'], conn_data['style'])
-            connection.setPen(pen)
+                # Set style
+                pen = QPen(conn_data['color'], conn_data['width'], conn_data['style'])
+                connection.setPen(pen)
 
-            # Add joints
-            for joint_pos in conn_data['joints']:
-                # Apply offset to joint position
-                new_pos = QPointF(joint_pos.x() + offset_x, joint_pos.y() + offset_y)
-                joint = connection.add_joint_at_point(new_pos)
+                # Add joints
+                for joint_pos in conn_data['joints']:
+                    # Apply offset to joint position
+                    joint = connection.add_joint_at_point(joint_pos + offset)
 
-                # Track new joint
-                new_joints.append(joint)
+                    # Track new joint
+                    new_joints.append(joint)
 
-            # Add to scene
-            self.scene.addItem(connection)
+                # Add to scene
+                self._add_item(connection)
 
-            # Select connection
-            connection.setSelected(True)
+                # Select connection
+                connection.setSelected(True)
 
-            # Track new connection
-            new_connections.append(connection)
+                # Track new connection
+                new_connections.append(connection)
 
-        # Select all joints
-        for joint in new_joints:
-            joint.setSelected(True)
+            # Select all joints
+            for joint in new_joints:
+                joint.setSelected(True)
 
         # Property panel will update automatically due to selection change
 
@@ -1420,24 +1760,9 @@ class Canvas(QGraphicsView):
         """Toggle visibility of Point entities and their relationships."""
         self.points_visible = not self.points_visible
 
-        for item in self.scene.items():
-            # Hide/show Point entities
-            if isinstance(item, EntityItem):
-                if isinstance(item.entity, Point):
-                    item.setVisible(self.points_visible)
-
-            # Hide/show Point-related connections and their arrows
-            elif isinstance(item, ConnectionItem):
-                relation_type = item.relationship_type
-                is_point_relation = (relation_type == rdflib.BRICK.hasPoint or relation_type == rdflib.BRICK.isPointOf)
-
-                if is_point_relation:
-                    # Hide/show the connection line
-                    item.setVisible(self.points_visible)
-
-                    # Hide/show all arrows for this connection
-                    for arrow in item.arrows:
-                        arrow.setVisible(self.points_visible)
+        # Hide/show Point entities and their connections (arrows are part of the path)
+        for item in itertools.chain(self._point_entity_items, self._point_connection_items):
+            item.setVisible(self.points_visible)
 
         # Update status message
         status = "showing" if self.points_visible else "hiding"
@@ -1466,9 +1791,12 @@ class Canvas(QGraphicsView):
         msg.exec_()
 
     def select_all(self):
-        for item in self.scene.items():
-            if isinstance(item, (EntityItem, ConnectionItem, JointItem)):
-                item.setSelected(True)
+        # Only entities, connections and joints are selectable, so one
+        # area covering the whole scene selects exactly those in Qt
+        path = QPainterPath()
+        path.addRect(self.scene.sceneRect().united(self.scene.itemsBoundingRect()))
+        with self._batched_selection():
+            self.scene.setSelectionArea(path, Qt.IntersectsItemBoundingRect)
 
     def to_rdf_graph(self) -> rdflib.Graph:
         """
@@ -1477,164 +1805,166 @@ class Canvas(QGraphicsView):
         g = rdflib.Graph()
         bind_namespaces(g=g)
 
+        # Collect all triples first and insert them into the graph in one batch
+        triples = []
+        add = triples.append
+
         # Store all entities
-        for item in self.scene.items():
+        for item in self._entity_items:
+            instance_uri = item.instance_uri
+            add((instance_uri, _RDF_TYPE, item.entity.uri_ref))
 
-            if isinstance(item, EntityItem):
-                g.add((item.instance_uri, rdflib.RDF.type, item.entity.uri_ref))
+            pos = item.pos()
+            pos_node = rdflib.BNode()
+            add((instance_uri, _VISU_HAS_POSITION, pos_node))
+            add((pos_node, _VISU_X, rdflib.Literal(float(pos.x()))))
+            add((pos_node, _VISU_Y, rdflib.Literal(float(pos.y()))))
 
-                pos = item.pos()
-                pos_node = rdflib.BNode()
-                g.add((item.instance_uri, VISU.hasPosition, pos_node))
-                g.add((pos_node, VISU.x, rdflib.Literal(float(pos.x()))))
-                g.add((pos_node, VISU.y, rdflib.Literal(float(pos.y()))))
-
-                rotation_literal = rdflib.Literal(
-                    item.rotation_angle,
-                    datatype=rdflib.XSD.integer
-                )
-                g.add((item.instance_uri, VISU.rotation, rotation_literal))
-
-                if item.label:
-                    g.add((
-                        item.instance_uri,
-                        rdflib.RDFS.label,
-                        rdflib.Literal(item.label, datatype=rdflib.XSD.string)
-                    ))
-
-                if isinstance(item.entity, Point) and item.external_reference:
-                    ref_data = item.external_reference
-                    ref_node = BLDG[short_uuid()]
-
-                    g.add((item.instance_uri, BRICK_REF.hasExternalReference, ref_node))
-
-                    ref_type = ref_data.get('type')
-
-                    if ref_type == "BACnet":
-                        g.add((ref_node, RDF.type, BRICK_REF.BACnetReference))
-
-                        option = ref_data.get('option', 1)
-
-                        if option == 1:
-                            if 'object-identifier' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET['object-identifier'],
-                                    rdflib.Literal(ref_data['object-identifier'])
-                                ))
-
-                            if 'object-name' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET['object-name'],
-                                    rdflib.Literal(ref_data['object-name'])
-                                ))
-
-                            if 'object-type' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET['object-type'],
-                                    rdflib.Literal(ref_data['object-type'])
-                                ))
-
-                            prop_id_key = (
-                                'property-identifier'
-                                if 'property-identifier' in ref_data
-                                else 'read-property'
-                            )
-
-                            if prop_id_key in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET['property-identifier'],
-                                    rdflib.Literal(ref_data[prop_id_key])
-                                ))
-
-                            if 'objectOf' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET.objectOf,
-                                    rdflib.Literal(ref_data['objectOf'])
-                                ))
-
-                        elif option == 2:
-                            if 'BACnetURI' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BRICK.BACnetURI,
-                                    rdflib.Literal(ref_data['BACnetURI'])
-                                ))
-
-                            if 'objectOf' in ref_data:
-                                g.add((
-                                    ref_node,
-                                    BACNET.objectOf,
-                                    rdflib.Literal(ref_data['objectOf'])
-                                ))
-
-                    elif ref_type == "Timeseries":
-                        g.add((ref_node, RDF.type, BRICK_REF.TimeseriesReference))
-
-                        if 'timeseriesId' in ref_data:
-                            g.add((
+            add((instance_uri, _VISU_ROTATION, _int_literal(item.rotation_angle)))
+
+            if item.label:
+                add((
+                    instance_uri,
+                    _RDFS_LABEL,
+                    rdflib.Literal(item.label, datatype=_XSD_STRING)
+                ))
+
+            if item.is_point and item.external_reference:
+                ref_data = item.external_reference
+                ref_node = BLDG[short_uuid()]
+
+                add((instance_uri, _REF_HAS_EXTERNAL_REFERENCE, ref_node))
+
+                ref_type = ref_data.get('type')
+
+                if ref_type == "BACnet":
+                    add((ref_node, _RDF_TYPE, BRICK_REF.BACnetReference))
+
+                    option = ref_data.get('option', 1)
+
+                    if option == 1:
+                        if 'object-identifier' in ref_data:
+                            add((
+                                ref_node,
+                                BACNET['object-identifier'],
+                                rdflib.Literal(ref_data['object-identifier'])
+                            ))
+
+                        if 'object-name' in ref_data:
+                            add((
+                                ref_node,
+                                BACNET['object-name'],
+                                rdflib.Literal(ref_data['object-name'])
+                            ))
+
+                        if 'object-type' in ref_data:
+                            add((
                                 ref_node,
-                                BRICK_REF.hasTimeseriesId,
-                                rdflib.Literal(ref_data['timeseriesId'])
+                                BACNET['object-type'],
+                                rdflib.Literal(ref_data['object-type'])
                             ))
 
-                        if 'storedAt' in ref_data:
-                            stored_at_value = ref_data['storedAt']
-
-                            if stored_at_value.startswith(("http://", "https://", "urn:", "file:")):
-                                g.add((
-                                    ref_node,
-                                    BRICK_REF.storedAt,
-                                    rdflib.URIRef(stored_at_value)
-                                ))
-                            else:
-                                g.add((
-                                    ref_node,
-                                    BRICK_REF.storedAt,
-                                    rdflib.Literal(stored_at_value)
-                                ))
+                        prop_id_key = (
+                            'property-identifier'
+                            if 'property-identifier' in ref_data
+                            else 'read-property'
+                        )
+
+                        if prop_id_key in ref_data:
+                            add((
+                                ref_node,
+                                BACNET['property-identifier'],
+                                rdflib.Literal(ref_data[prop_id_key])
+                            ))
+
+                        if 'objectOf' in ref_data:
+                            add((
+                                ref_node,
+                                BACNET.objectOf,
+                                rdflib.Literal(ref_data['objectOf'])
+                            ))
+
+                    elif option == 2:
+                        if 'BACnetURI' in ref_data:
+                            add((
+                                ref_node,
+                                BRICK.BACnetURI,
+                                rdflib.Literal(ref_data['BACnetURI'])
+                            ))
+
+                        if 'objectOf' in ref_data:
+                            add((
+                                ref_node,
+                                BACNET.objectOf,
+                                rdflib.Literal(ref_data['objectOf'])
+                            ))
+
+                elif ref_type == "Timeseries":
+                    add((ref_node, _RDF_TYPE, BRICK_REF.TimeseriesReference))
+
+                    if 'timeseriesId' in ref_data:
+                        add((
+                            ref_node,
+                            BRICK_REF.hasTimeseriesId,
+                            rdflib.Literal(ref_data['timeseriesId'])
+                        ))
+
+                    if 'storedAt' in ref_data:
+                        stored_at_value = ref_data['storedAt']
+
+                        if stored_at_value.startswith(("http://", "https://", "urn:", "file:")):
+                            add((
+                                ref_node,
+                                BRICK_REF.storedAt,
+                                rdflib.URIRef(stored_at_value)
+                            ))
+                        else:
+                            add((
+                                ref_node,
+                                BRICK_REF.storedAt,
+                                rdflib.Literal(stored_at_value)
+                            ))
 
         # Store all connections
-        for item in self.scene.items():
-            if isinstance(item, ConnectionItem) and item.source_port and item.target_port:
+        for item in self._connection_items:
+            if item.source_port and item.target_port:
                 source_uri = item.get_source_entity_uri()
                 target_uri = item.get_target_entity_uri()
 
                 if source_uri and target_uri:
-                    g.add((source_uri, item.relationship_type, target_uri))
+                    instance_uri = item.instance_uri
+                    add((source_uri, item.relationship_type, target_uri))
 
-                    g.add((item.instance_uri, rdflib.RDF.type, VISU.Connection))
-                    g.add((item.instance_uri, VISU.sourceEntity, source_uri))
-                    g.add((item.instance_uri, VISU.targetEntity, target_uri))
-                    g.add((item.instance_uri, VISU.relationshipType, item.relationship_type))
+                    add((instance_uri, _RDF_TYPE, _VISU_CONNECTION))
+                    add((instance_uri, _VISU_SOURCE_ENTITY, source_uri))
+                    add((instance_uri, _VISU_TARGET_ENTITY, target_uri))
+                    add((instance_uri, _VISU_RELATIONSHIP_TYPE, item.relationship_type))
 
-                    color = item.pen().color()
+                    pen = item.pen()
+                    color = pen.color()
                     color_node = rdflib.BNode()
 
-                    g.add((item.instance_uri, VISU.color, color_node))
-                    g.add((color_node, VISU.red, rdflib.Literal(color.red(), datatype=rdflib.XSD.integer)))
-                    g.add((color_node, VISU.green, rdflib.Literal(color.green(), datatype=rdflib.XSD.integer)))
-                    g.add((color_node, VISU.blue, rdflib.Literal(color.blue(), datatype=rdflib.XSD.integer)))
+                    add((instance_uri, _VISU_COLOR, color_node))
+                    add((color_node, _VISU_RED, _int_literal(color.red())))
+                    add((color_node, _VISU_GREEN, _int_literal(color.green())))
+                    add((color_node, _VISU_BLUE, _int_literal(color.blue())))
 
-                    pen_style = item.pen().style()
-                    g.add((item.instance_uri, VISU.lineStyle,
-                           rdflib.Literal(int(pen_style), datatype=rdflib.XSD.integer)))
+                    pen_style = pen.style()
+                    add((instance_uri, _VISU_LINE_STYLE, _int_literal(int(pen_style))))
 
-                    pen_width = item.pen().width()
-                    g.add((item.instance_uri, VISU.lineWidth, rdflib.Literal(pen_width, datatype=rdflib.XSD.integer)))
+                    pen_width = pen.width()
+                    add((instance_uri, _VISU_LINE_WIDTH, _int_literal(pen_width)))
 
                     for i, joint in enumerate(item.joints):
                         joint_node = rdflib.BNode()
-                        g.add((item.instance_uri, VISU.hasJoint, joint_node))
-                        g.add((joint_node, VISU.jointIndex, rdflib.Literal(i, datatype=rdflib.XSD.integer)))
+                        add((instance_uri, _VISU_HAS_JOINT, joint_node))
+                        add((joint_node, _VISU_JOINT_INDEX, _int_literal(i)))
 
                         joint_pos = joint.scenePos()
-                        g.add((joint_node, VISU.x, rdflib.Literal(float(joint_pos.x()), datatype=rdflib.XSD.float)))
-                        g.add((joint_node, VISU.y, rdflib.Literal(float(joint_pos.y()), datatype=rdflib.XSD.float)))
+                        add((joint_node, _VISU_X, rdflib.Literal(float(joint_pos.x()), datatype=_XSD_FLOAT)))
+                        add((joint_node, _VISU_Y, rdflib.Literal(float(joint_pos.y()), datatype=_XSD_FLOAT)))
+
+        g.addN((subject, predicate, obj, g) for subject, predicate, obj in triples)
 
         return g
 
@@ -1667,12 +1997,20 @@ class Canvas(QGraphicsView):
         self.import_from_graph(g=g)
 
     def import_from_graph(self, g: rdflib.Graph):
+        """Import entities and connections from an RDF graph."""
+        with self._bulk_add(reindex=True):
+            self._import_graph_items(g)
+
+    def _import_graph_items(self, g: rdflib.Graph):
         print(f"Starting import_from_graph with {len(g)} triples")
 
         # Define design namespace explicitly as a string prefix
 
         print(f"Using design namespace: {VISU}")
 
+        # Read types and visual properties in one pass instead of querying the store per field
+        types, values, objects, relationships = _index_graph(g)
+
         # Dictionary to keep track of loaded entities by URI
         loaded_entities = {}
 
@@ -1681,12 +2019,12 @@ class Canvas(QGraphicsView):
         entity_count = 0
         skipped_count = 0
 
-        for subject, predicate, obj in g.triples((None, rdflib.RDF.type, None)):
+        for subject, obj in types:
             # Skip connections - we'll handle them in the second pass
-            if obj == VISU.Connection:
+            if obj == _VISU_CONNECTION:
                 continue
 
-            if not str(obj).startswith(str(BRICK)) and not str(obj).startswith(str(REC)):
+            if not str(obj).startswith(_ENTITY_NAMESPACES):
                 # Skip non-BRICK entities
                 continue
 
@@ -1700,7 +2038,7 @@ class Canvas(QGraphicsView):
                 entity_item.instance_uri = subject
 
                 # Add to scene
-                self.scene.addItem(entity_item)
+                self._add_item(entity_item)
 
                 # Store in loaded entities dictionary
                 loaded_entities[str(subject)] = entity_item
@@ -1722,44 +2060,38 @@ class Canvas(QGraphicsView):
             entity_uri = rdflib.URIRef(entity_uri_str)
 
             # Set position
-            for pos_node in g.objects(subject=entity_uri, predicate=VISU.hasPosition):
-                x = float(g.value(subject=pos_node, predicate=VISU.x, default=0))
-                y = float(g.value(subject=pos_node, predicate=VISU.y, default=0))
+            for pos_node in objects[_VISU_HAS_POSITION].get(entity_uri, ()):
+                x = float(values[_VISU_X].get(pos_node, 0))
+                y = float(values[_VISU_Y].get(pos_node, 0))
                 print(f"  - Setting position: ({x}, {y})")
                 entity_item.setPos(x, y)
 
             # Set rotation
-            rotation_val = g.value(entity_uri, VISU.rotation, default=0)
+            rotation_val = values[_VISU_ROTATION].get(entity_uri, 0)
             if rotation_val:
                 print(f"  - Setting rotation: {rotation_val}")
                 entity_item.apply_rotation(int(rotation_val))
 
             # Set label
-            label = g.value(entity_uri, rdflib.RDFS.label)
+            label = values[_RDFS_LABEL].get(entity_uri)
             if label:
                 print(f"  - Setting label: {label}")
                 entity_item.label = str(label)
         print("Loading external references...")
-        # Query for points that have an external reference node
-        ref_query = """
-                  SELECT DISTINCT ?point_uri ?ref_node
-                  WHERE {
-                      ?point_uri ref:hasExternalReference ?ref_node .
-                      # Optional: Add constraint if points must have a specific type
-                      # ?point_uri rdf:type brick:Point .
-                  }
-               """
-        qres_refs = g.query(ref_query, initNs={"ref": BRICK_REF, "brick": BRICK, "rdf": RDF})
-        print(f"Found {len(list(qres_refs))} potential points with external references")
-        qres_refs = g.query(ref_query, initNs={"ref": BRICK_REF, "brick": BRICK, "rdf": RDF})  # Re-run
+        # Point -> reference node links, collected by the same pass as the other import predicates
+        ref_links = [
+            (point_uri, ref_node)
+            for point_uri, ref_nodes in objects[_REF_HAS_EXTERNAL_REFERENCE].items()
+            for ref_node in ref_nodes
+        ]
+        print(f"Found {len(ref_links)} potential points with external references")
 
         ref_count = 0
-        for row in qres_refs:
-            point_uri, ref_node = row
+        for point_uri, ref_node in ref_links:
             # print(f"Processing reference link: {point_uri} -> {ref_node}")
 
             entity_item = loaded_entities.get(str(point_uri))
-            if not entity_item or not hasattr(entity_item, 'entity') or not isinstance(entity_item.entity, Point):
+            if not entity_item or not entity_item.is_point:
                 print(f"  - Skipping: Entity {point_uri} not loaded or not a Point type.")
                 continue
 
@@ -1858,12 +2190,14 @@ class Canvas(QGraphicsView):
         print("Second pass: Loading visual connections...")
         visual_conn_count = 0
 
-        for conn_uri in g.subjects(rdflib.RDF.type, VISU.Connection):
+        connection_uris = [subject for subject, obj in types if obj == _VISU_CONNECTION]
+
+        for conn_uri in connection_uris:
             print(f"Processing connection: {conn_uri}")
 
             # Get source and target
-            source_uri = g.value(conn_uri, VISU.sourceEntity)
-            target_uri = g.value(conn_uri, VISU.targetEntity)
+            source_uri = values[_VISU_SOURCE_ENTITY].get(conn_uri)
+            target_uri = values[_VISU_TARGET_ENTITY].get(conn_uri)
 
             if not source_uri or not target_uri:
                 print(f"  - Skipping: Missing source or target")
@@ -1887,22 +2221,22 @@ class Canvas(QGraphicsView):
             connection.instance_uri = conn_uri
 
             # Set relationship type
-            rel_type_str = g.value(conn_uri, rdflib.URIRef(VISU + "relationshipType"))
+            rel_type_str = values[_VISU_RELATIONSHIP_TYPE].get(conn_uri)
             if rel_type_str:
                 print(f"  - Setting relationship type: {rel_type_str}")
-                for rel_name, rel_uri in BRICK_RELATIONSHIPS.items():
-                    if str(rel_uri) == str(rel_type_str):
-                        connection.set_relationship_type(rel_uri)
-                        print(f"  - Matched to known relationship: {rel_name}")
-                        # Track this relationship as processed
-                        processed_relationships.add((str(source_uri), str(rel_uri), str(target_uri)))
-                        break
+                rel_name = BRICK_RELATIONSHIP_NAMES.get(str(rel_type_str))
+                if rel_name is not None:
+                    rel_uri = BRICK_RELATIONSHIPS[rel_name]
+                    connection.set_relationship_type(rel_uri)
+                    print(f"  - Matched to known relationship: {rel_name}")
+                    # Track this relationship as processed
+                    processed_relationships.add((str(source_uri), str(rel_uri), str(target_uri)))
 
             # Set color
-            for color_node in g.objects(conn_uri, rdflib.URIRef(VISU + "color")):
-                red_val = g.value(color_node, VISU.red, default=0)
-                green_val = g.value(color_node, VISU.green, default=0)
-                blue_val = g.value(color_node, VISU.blue, default=0)
+            for color_node in objects[_VISU_COLOR].get(conn_uri, ()):
+                red_val = values[_VISU_RED].get(color_node, 0)
+                green_val = values[_VISU_GREEN].get(color_node, 0)
+                blue_val = values[_VISU_BLUE].get(color_node, 0)
 
                 # Convert to integers regardless of value
                 red = int(red_val)
@@ -1913,14 +2247,14 @@ class Canvas(QGraphicsView):
                 print(f"  - Setting color: RGB({red}, {green}, {blue})")
 
                 # Set line style
-                style_val = g.value(conn_uri, VISU.lineStyle)
+                style_val = values[_VISU_LINE_STYLE].get(conn_uri)
                 line_style_val = Qt.SolidLine
                 if style_val:
                     line_style_val = Qt.PenStyle(int(style_val))
                     print(f"  - Setting line style: {line_style_val}")
 
                 # Set line width
-                width_val = g.value(conn_uri, VISU.lineWidth, default=2)
+                width_val = values[_VISU_LINE_WIDTH].get(conn_uri, 2)
                 width = int(width_val) if width_val else 2
                 print(f"  - Setting line width: {width}")
 
@@ -1929,16 +2263,16 @@ class Canvas(QGraphicsView):
                 connection.setPen(pen)
 
             # Add to scene
-            self.scene.addItem(connection)
+            self._add_item(connection)
             visual_conn_count += 1
 
             # Load joints
             joint_data = []
             joint_count = 0
-            for joint_node in g.objects(conn_uri, rdflib.URIRef(VISU + "hasJoint")):
-                idx_val = g.value(joint_node, VISU.jointIndex)
-                x_val = g.value(joint_node, VISU.x)
-                y_val = g.value(joint_node, VISU.y)
+            for joint_node in objects[_VISU_HAS_JOINT].get(conn_uri, ()):
+                idx_val = values[_VISU_JOINT_INDEX].get(joint_node)
+                x_val = values[_VISU_X].get(joint_node)
+                y_val = values[_VISU_Y].get(joint_node)
 
                 if idx_val is not None and x_val is not None and y_val is not None:
                     idx = int(idx_val)
@@ -1965,9 +2299,9 @@ class Canvas(QGraphicsView):
         print("Third pass: Creating implicit connections from relationships...")
         implicit_conn_count = 0
 
-        for relation_uri in BRICK_RELATIONSHIPS.values():
+        for relation_uri, related in relationships.items():
             print(f"Checking for implicit {relation_uri} relationships...")
-            for source_uri, _, target_uri in g.triples((None, relation_uri, None)):
+            for source_uri, target_uri in related:
                 print(f"Found relationship: {source_uri} -> {target_uri}")
 
                 # Skip if source or target is not a loaded entity
@@ -2000,7 +2334,7 @@ class Canvas(QGraphicsView):
                 connection.setPen(pen)
 
                 # Add to scene
-                self.scene.addItem(connection)
+                self._add_item(connection)
                 implicit_conn_count += 1
 
                 # Update connection
@@ -10,11 +10,10 @@ from PyQt5.QtGui import (
 from PyQt5.QtCore import Qt
 
 from src.app.widgets import (
-    EntityBrowser, PropertyPanel, Canvas,
+    EntityBrowser, PropertyPanel, Canvas, TOOLBAR_ZOOM_LEVELS,
 )
 
 from src.ifc import extract_topology
-from src.app.items import EntityItem, ConnectionItem
 from src.validation.shacl import validate_graph_with_shacl
 from src.app.shacl_dialogs import ShaclValidationReportDialog
 from src.ontologies.reasoning import reason_with_owlrl
@@ -56,7 +55,7 @@ class DiagramApplication(QMainWindow):
         # Add toolbar
         self._setup_toolbar()
 
-        self.statusBar().showMessage("Ready")
+        self.canvas.show_message("Ready")
 
     def _setup_entity_browser(self):
         """Create and configure entity browser dock widget."""
@@ -124,21 +123,21 @@ class DiagramApplication(QMainWindow):
 
     def _zoom_in(self):
         """Zoom in with notification."""
-        self.canvas.scale(1.2, 1.2)
+        self.canvas.zoom_by(TOOLBAR_ZOOM_LEVELS)
 
-        self.statusBar().showMessage("Zoomed in")
+        self.canvas.show_message("Zoomed in")
 
     def _zoom_out(self):
         """Zoom out with notification."""
 
-        self.canvas.scale(1 / 1.2, 1 / 1.2)
-        self.statusBar().showMessage("Zoomed out")
+        self.canvas.zoom_by(-TOOLBAR_ZOOM_LEVELS)
+        self.canvas.show_message("Zoomed out")
 
     def _reset_zoom(self):
         """Reset canvas zoom to 100%."""
 
-        self.canvas.resetTransform()
-        self.statusBar().showMessage("Zoom reset to 100%")
+        self.canvas.reset_zoom()
+        self.canvas.show_message("Zoom reset to 100%")
 
     def _setup_menu_bar(self):
         """Create and configure application menu bar."""
@@ -231,7 +230,7 @@ class DiagramApplication(QMainWindow):
             try:
                 success = self.canvas.save_to_turtle(file_path)
                 if success:
-                    self.statusBar().showMessage(f"Design saved to {file_path}")
+                    self.canvas.show_message(f"Design saved to {file_path}")
 
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Error saving design: {str(e)}")
@@ -246,7 +245,7 @@ class DiagramApplication(QMainWindow):
             try:
                 success = self.canvas.load_from_turtle(file_path)
                 if success:
-                    self.statusBar().showMessage(f"Design loaded from {file_path}")
+                    self.canvas.show_message(f"Design loaded from {file_path}")
 
             except Exception as e:
                 QMessageBox.critical(self, "Import Error", f"Error loading design: {str(e)}")
@@ -301,7 +300,7 @@ class DiagramApplication(QMainWindow):
                         # Load the TTL file directly without URI replacement
                         # This simpler approach may help identify if the issue is in the complex URI handling
                         self.canvas.load_from_turtle(ttl_file)
-                        self.statusBar().showMessage(f"Imported {ttl_file}")
+                        self.canvas.show_message(f"Imported {ttl_file}")
                         print(f"Successfully imported {ttl_file}")
                     except Exception as e:
                         error_msg = f"Error importing {ttl_file}: {str(e)}"
@@ -319,7 +318,7 @@ class DiagramApplication(QMainWindow):
                         print(f"Importing TTL file: {ifc_file}")
 
                         self.canvas.load_from_ifc(ifc_file)
-                        self.statusBar().showMessage(f"Imported {ifc_file}")
+                        self.canvas.show_message(f"Imported {ifc_file}")
                         print(f"Successfully imported {ifc_file}")
                     except Exception as e:
                         error_msg = f"Error importing {ifc_file}: {str(e)}"
@@ -332,15 +331,7 @@ class DiagramApplication(QMainWindow):
     def _collect_existing_uris(self):
         """Collect all existing instance URIs from canvas items."""
 
-        existing_uris = set()
-
-        for item in self.canvas.scene.items():
-            if isinstance(item, EntityItem):
-                existing_uris.add(str(item.instance_uri))
-            elif isinstance(item, ConnectionItem):
-                existing_uris.add(str(item.instance_uri))
-
-        return existing_uris
+        return {str(item.instance_uri) for item in self.canvas.iter_uri_items()}
 
     def _replace_instance_uris(self, graph, existing_uris):
         """Replace instance URIs in the graph to avoid conflicts with existing ones."""
@@ -399,7 +390,7 @@ class DiagramApplication(QMainWindow):
             test_graph.parse(file_path, format="turtle")
 
             self.shacl_file_path = file_path
-            self.statusBar().showMessage(f"Loaded SHACL shapes: {file_path}")
+            self.canvas.show_message(f"Loaded SHACL shapes: {file_path}")
 
             QMessageBox.information(
                 self,
@@ -443,14 +434,14 @@ class DiagramApplication(QMainWindow):
             )
 
             if validation_result.conforms:
-                self.statusBar().showMessage("SHACL validation passed")
+                self.canvas.show_message("SHACL validation passed")
                 QMessageBox.information(
                     self,
                     "SHACL Validation Passed",
                     "The current design conforms to the loaded SHACL constraints."
                 )
             else:
-                self.statusBar().showMessage(
+                self.canvas.show_message(
                     f"SHACL validation failed: {len(validation_result.violations)} result(s)"
                 )
 